@@ -0,0 +1,333 @@
+import argparse
+import csv
+import importlib.util
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from operator import itemgetter
+
+SOLUTIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# How to run each day: a parse function taking (module, input_path) and the two
+# part functions taking (module, parsed_input). Parts may mutate their input, so
+# the runner re-parses before every timed part call.
+DAYS = {
+    "day01": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.calculate_total_distance(*data),
+        lambda m, data: m.calculate_similarity_score(*data),
+    ),
+    "day02": (
+        lambda m, path: (m.read_input(path), m.read_input_by_length(path)),
+        lambda m, data: m.count_safe_reports(data[0], use_dampener=False),
+        lambda m, data: m.count_safe_reports(data[0], use_dampener=True),
+    ),
+    "day03": (
+        lambda m, path: (m.read_input(path), path),
+        lambda m, data: m.sum_multiplications(data[0]),
+        lambda m, data: m.sum_active_multiplications(data[0]),
+    ),
+    "day04": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.find_occurrences(data, mode="XMAS"),
+        lambda m, data: m.find_occurrences(data, mode="X-MAS"),
+    ),
+    "day05": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.calc_middle_pages(*data),
+        lambda m, data: m.calc_middle_pages(*data, process_valid_updates=False),
+    ),
+    "day06": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.calculate_guard_visited_positions(data),
+        lambda m, data: m.find_obstruction_positions(data),
+    ),
+    "day07": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.sum_solvable_equation_targets(data, allow_concatenation=False),
+        lambda m, data: m.sum_solvable_equation_targets(data, allow_concatenation=True),
+    ),
+    "day08": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.count_valid_antinodes(data[0], m.calculate_antinodes(*data, include_antenna_positions=False)),
+        lambda m, data: m.count_valid_antinodes(data[0], m.calculate_antinodes(*data, include_antenna_positions=True)),
+    ),
+    "day09": (
+        lambda m, path: (m.read_input_p1(path), m.read_input_p2(path), m.read_disk_map(path)),
+        lambda m, data: m.compact_disk_and_calculate_checksum(data[0]),
+        lambda m, data: m.compact_files_by_whole_blocks_and_calculate_checksum(*data[1]),
+    ),
+    "day10": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.calculate_total_score(data, "score"),
+        lambda m, data: m.calculate_total_score(data, "rating"),
+    ),
+    "day11": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: m.simulate_blinks(data),
+        lambda m, data: sum(m.calc_stones_after_blinks(stone, 75) for stone in data),
+    ),
+    "day12": (
+        lambda m, path: m.read_input(path),
+        lambda m, data: sum(len(region) * m.calculate_region_perimeter(region) for region in m.find_regions(data)),
+        lambda m, data: sum(len(region) * m.count_sides(region) for region in m.find_regions(data)),
+    ),
+}
+
+# Alternative implementations timed as extra phases next to part1/part2, keyed by day and phase name.
+VARIANTS = {
+    "day02": {
+        "part1_vectorized": lambda m, data: m.count_safe_reports_by_length(data[1], use_dampener=False),
+        "part2_vectorized": lambda m, data: m.count_safe_reports_by_length(data[1], use_dampener=True),
+        "part2_linear": lambda m, data: m.count_safe_reports(data[0], safety_check=m.is_report_safe_with_dampener_linear),
+    },
+    "day03": {
+        "both_mmap": lambda m, data: m.scan_memory_file(data[1]),
+    },
+    "day04": {
+        "part1_vectorized": lambda m, data: m.find_occurrences_vectorized(data, mode="XMAS"),
+        "part2_vectorized": lambda m, data: m.find_occurrences_vectorized(data, mode="X-MAS"),
+    },
+    "day05": {
+        "part1_adjacent": lambda m, data: m.calc_middle_pages(*data, adjacent_only=True),
+        "part2_adjacent": lambda m, data: m.calc_middle_pages(*data, process_valid_updates=False, adjacent_only=True),
+        "part2_counting": lambda m, data: m.calc_middle_pages(*data, process_valid_updates=False, count_middle=True),
+        "part2_vectorized": lambda m, data: m.calc_middle_pages_vectorized(*data, process_valid_updates=False),
+    },
+    "day06": {
+        "part2_route": lambda m, data: m.find_obstruction_positions_on_route(data),
+        "part2_flat": lambda m, data: m.find_obstruction_positions_flat(data),
+    },
+    "day07": {
+        "part1_fast": lambda m, data: m.sum_solvable_equation_targets(data, allow_concatenation=False, solver=m.is_equation_solvable_fast),
+        "part2_fast": lambda m, data: m.sum_solvable_equation_targets(data, allow_concatenation=True, solver=m.is_equation_solvable_fast),
+        "part2_parallel": lambda m, data: m.sum_solvable_equation_targets_parallel(data, allow_concatenation=True),
+    },
+    "day08": {
+        "part1_bitmap": lambda m, data: int(m.calculate_antinode_bitmap(*data, include_antenna_positions=False).sum()),
+        "part2_bitmap": lambda m, data: int(m.calculate_antinode_bitmap(*data, include_antenna_positions=True).sum()),
+    },
+    "day09": {
+        "part1_stream": lambda m, data: m.compact_disk_map_and_calculate_checksum(data[2]),
+        "part2_heaps": lambda m, data: m.compact_files_with_free_space_heaps(*data[1]),
+    },
+    "day10": {
+        "part1_dp": lambda m, data: m.calculate_total_score_dp(data, "score"),
+        "part2_dp": lambda m, data: m.calculate_total_score_dp(data, "rating"),
+        "part1_bitsets": lambda m, data: m.calculate_total_score_bitsets(data),
+    },
+    "day11": {
+        "part1_count_map": lambda m, data: m.count_stones_after_blinks(data, 25),
+        "part2_count_map": lambda m, data: m.count_stones_after_blinks(data, 75),
+        "part2_memoized": lambda m, data: m.count_stones_after_blinks(data, 75, transition=m.memoized_blink()),
+        "part2_vectorized": lambda m, data: m.count_stones_vectorized(data, 75),
+    },
+    "day12": {
+        "part1_scanline": lambda m, data: m.fencing_price(*itemgetter(1, 2)(m.label_regions(data))),
+        "part2_scanline": lambda m, data: m.fencing_price(*itemgetter(1, 3)(m.label_regions(data))),
+        "part2_windows": lambda m, data: int(m.fencing_price(*itemgetter(0, 2)(m.measure_regions_vectorized(m.label_regions(data)[0])))),
+    },
+}
+
+
+def discover_days(selected=None):
+    """
+    Find the dayNN solution directories that have a dayNN.py module and a runner entry.
+
+    Returns a sorted list of day names.
+    """
+    days = []
+    for name in sorted(os.listdir(SOLUTIONS_DIR)):
+        if name not in DAYS:
+            continue
+        if selected and name not in selected:
+            continue
+        if os.path.isfile(os.path.join(SOLUTIONS_DIR, name, f"{name}.py")):
+            days.append(name)
+    return days
+
+
+def load_day_module(day, module_name=None):
+    """
+    Import a module from a day's directory by file path (the day directories are not packages).
+    Loads <day>/<day>.py unless another module name is given.
+
+    Returns the imported module.
+    """
+    module_name = module_name or day
+    path = os.path.join(SOLUTIONS_DIR, day, f"{module_name}.py")
+    spec = importlib.util.spec_from_file_location(module_name if module_name == day else f"{day}_{module_name}", path)
+    module = importlib.util.module_from_spec(spec)
+    # register the module so process pools can pickle references to its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_input_path(day, input_dir=None):
+    """
+    Locate the input file for a day: <input_dir>/<day>.txt if given and present, otherwise <day>/input.txt.
+
+    Returns the input file path.
+    """
+    if input_dir:
+        path = os.path.join(input_dir, f"{day}.txt")
+        if os.path.isfile(path):
+            return path
+    return os.path.join(SOLUTIONS_DIR, day, "input.txt")
+
+
+def percentile(samples, fraction):
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Returns the sample at the given fraction (0-1) of the sorted list.
+    """
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def clear_caches(module):
+    """
+    Clear every functools cache (e.g. day11's `calc_stones_after_blinks`) defined in a day's module, so
+    that repeated runs do real work instead of returning memoized results.
+    """
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+
+def time_phase(setup, run, repeats):
+    """
+    Time a single phase. The first call is the cold run (first call in this process), the following
+    `repeats` calls are warm runs. `setup` builds fresh arguments for each call outside the timed region.
+
+    Returns a tuple (result, cold_time, warm_times).
+    """
+    args = setup()
+    start = time.perf_counter()
+    result = run(args)
+    cold = time.perf_counter() - start
+
+    warm = []
+    for _ in range(repeats):
+        args = setup()
+        start = time.perf_counter()
+        run(args)
+        warm.append(time.perf_counter() - start)
+
+    return result, cold, warm
+
+
+def measure_peak_memory(setup, run):
+    """
+    Run a phase once under tracemalloc.
+
+    Returns the peak traced memory in bytes allocated during the call.
+    """
+    args = setup()
+    tracemalloc.start()
+    try:
+        run(args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark_day(day, input_path, repeats=5, measure_memory=True):
+    """
+    Benchmark the parse, part 1 and part 2 phases of one day, plus any VARIANTS registered for it.
+
+    Returns a list of result rows (dicts), one per phase.
+    """
+    module = load_day_module(day)
+    parse, part1, part2 = DAYS[day]
+
+    def setup():
+        clear_caches(module)
+        return parse(module, input_path)
+
+    phases = [
+        ("parse", lambda: clear_caches(module), lambda _: parse(module, input_path)),
+        ("part1", setup, lambda data: part1(module, data)),
+        ("part2", setup, lambda data: part2(module, data)),
+    ]
+    for name, variant in VARIANTS.get(day, {}).items():
+        phases.append((name, setup, lambda data, variant=variant: variant(module, data)))
+
+    rows = []
+    for phase, setup, run in phases:
+        result, cold, warm = time_phase(setup, run, repeats)
+        samples = warm if warm else [cold]
+        rows.append({
+            "day": day,
+            "phase": phase,
+            "input": os.path.relpath(input_path, SOLUTIONS_DIR),
+            "repeats": len(warm),
+            "cold_s": cold,
+            "min_s": min(samples),
+            "median_s": statistics.median(samples),
+            "p95_s": percentile(samples, 0.95),
+            "peak_mem_bytes": measure_peak_memory(setup, run) if measure_memory else None,
+            "answer": None if phase == "parse" else str(result),
+        })
+    return rows
+
+
+def write_report(rows, output_file, fmt):
+    """
+    Write benchmark rows to a file (or stdout when output_file is '-') as JSON or CSV.
+    """
+    stream = sys.stdout if output_file == "-" else open(output_file, "w", newline="")
+    try:
+        if fmt == "json":
+            json.dump(rows, stream, indent=2)
+            stream.write("\n")
+        else:
+            writer = csv.DictWriter(stream, fieldnames=list(rows[0].keys()) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def print_summary(rows):
+    """
+    Print a human-readable table of the benchmark rows to stderr.
+    """
+    print(f"{'day':<6} {'phase':<18} {'cold ms':>10} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10}", file=sys.stderr)
+    for row in rows:
+        peak = "-" if row["peak_mem_bytes"] is None else f"{row['peak_mem_bytes'] / 1024:.1f}"
+        print(
+            f"{row['day']:<6} {row['phase']:<18} {row['cold_s'] * 1e3:>10.2f} {row['min_s'] * 1e3:>10.2f} "
+            f"{row['median_s'] * 1e3:>10.2f} {row['p95_s'] * 1e3:>10.2f} {peak:>10}",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time parse, part 1 and part 2 of every day's solution.")
+    parser.add_argument("days", nargs="*", help="days to run, e.g. day01 day06 (default: all)")
+    parser.add_argument("-n", "--repeats", type=int, default=5, help="warm runs per phase after the cold run")
+    parser.add_argument("--input-dir", help="directory with <day>.txt inputs to use instead of <day>/input.txt")
+    parser.add_argument("-o", "--output", default="-", help="report file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory run")
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.days) - set(DAYS))
+    if unknown:
+        parser.error(f"unknown day(s): {', '.join(unknown)} (expected names like day01)")
+
+    rows = []
+    for day in discover_days(args.days):
+        rows += benchmark_day(day, find_input_path(day, args.input_dir), args.repeats, not args.no_memory)
+
+    print_summary(rows)
+    write_report(rows, args.output, args.format)
@@ -0,0 +1,28 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 1000  # number of lines in the puzzle input
+DIMENSIONS = 1
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None):
+    """
+    Generate a location ID list input: `size` lines of two 5-digit numbers.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    # draw from a pool so that part 2 has repeated numbers to count
+    pool = [rng.randrange(10000, 100000) for _ in range(max(1, size // 2))]
+    return "\n".join(f"{rng.choice(pool)}   {rng.choice(pool)}" for _ in range(size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day01 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of lines")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed))
@@ -17,6 +17,17 @@ def read_input(input_file_dir):
     return array
 
 
+def iter_reports(input_file_dir):
+    """
+    Parse reactor safety reports one line at a time, for inputs too large to load at once.
+
+    Yields each report as a 1D numpy array.
+    """
+    with open(input_file_dir, "r") as f:
+        for line in f:
+            yield np.array(line.split(), dtype=int)
+
+
 def is_report_safe(report):
     """ 
     Determine if a single reactor report is safe. 
@@ -55,21 +66,165 @@ def is_report_safe_with_dampener(report):
     return 0
 
 
-def count_safe_reports(reports, use_dampener=False):
+def find_first_bad_level(levels, direction, skip=-1):
+    """
+    Scan a report once for the first step that is not a change of 1 to 3 in `direction` (1 ascending,
+    -1 descending), ignoring the level at index `skip`.
+
+    Returns the index of the level before the first bad step, or -1 if every step is good.
+    """
+    previous = -1
+    for i in range(len(levels)):
+        if i == skip:
+            continue
+        if previous != -1 and not 1 <= (levels[i] - levels[previous]) * direction <= 3:
+            return previous
+        previous = i
+    return -1
+
+
+def is_report_safe_with_dampener_linear(report):
+    """
+    Check if a report is safe using the Problem Dampener in linear time. For each direction, find the first bad
+    step between levels i and i + 1: any deletion other than i or i + 1 leaves that step in place, so only those
+    two candidates need to be tested.
+
+    Returns 0 if the report is unsafe, 1 if the report is safe.
+    """
+    levels = report.tolist() if hasattr(report, "tolist") else report
+    for direction in (1, -1):
+        bad = find_first_bad_level(levels, direction)
+        if bad == -1:
+            return 1
+        if find_first_bad_level(levels, direction, skip=bad) == -1 or find_first_bad_level(levels, direction, skip=bad + 1) == -1:
+            return 1
+    return 0
+
+
+def count_safe_reports(reports, use_dampener=False, safety_check=None):
     """ 
     Count the number of safe reports in a 2D array of reactor reports. Uses the Problem Dampener if specified.
+    A custom `safety_check` (e.g. is_report_safe_with_dampener_linear) replaces the default check for the mode.
     
     Returns the number of safe reports.
     """
-    safety_check = is_report_safe_with_dampener if use_dampener else is_report_safe
+    if safety_check is None:
+        safety_check = is_report_safe_with_dampener if use_dampener else is_report_safe
     return np.sum(np.fromiter((safety_check(report) for report in reports), dtype=int))
 
 
+def read_input_padded(input_file_dir):
+    """
+    Parse reactor safety reports from the input file into a single padded array.
+
+    Returns a tuple of two numpy arrays:
+    - levels: 2D array with one report per row, padded with zeros to the longest report.
+    - lengths: 1D array with the number of levels in each report.
+    """
+    with open(input_file_dir, "r") as f:
+        lines = f.read().splitlines()
+
+    lengths = np.array([len(line.split()) for line in lines], dtype=int)
+    flat = np.array(" ".join(lines).split(), dtype=int)
+
+    width = int(lengths.max()) if len(lengths) else 0
+    levels = np.zeros((len(lengths), width), dtype=int)
+    levels[np.arange(width) < lengths[:, None]] = flat
+
+    return levels, lengths
+
+
+def are_diffs_safe(levels, lengths):
+    """
+    Check many reports at once. `levels` holds one report per row along its last axis (padded past each
+    report's length) and `lengths` holds the matching report lengths, broadcastable to levels.shape[:-1].
+
+    Returns a boolean array with one entry per report, True where the report is safe.
+    """
+    diffs = np.diff(levels, axis=-1)
+    # differences past the end of a report are padding and always pass
+    padding = np.arange(diffs.shape[-1]) >= (lengths - 1)[..., None]
+    ascending = np.all(((diffs >= 1) & (diffs <= 3)) | padding, axis=-1)
+    descending = np.all(((diffs <= -1) & (diffs >= -3)) | padding, axis=-1)
+    return ascending | descending
+
+
+def read_input_by_length(input_file_dir):
+    """
+    Parse reactor safety reports from the input file into one array per report length, so that no report is
+    padded to the length of a longer one.
+
+    Returns a dict mapping each report length to a 2D numpy array with one report of that length per row.
+    """
+    with open(input_file_dir, "r") as f:
+        lines = f.read().splitlines()
+
+    rows_by_length = {}
+    for line in lines:
+        levels = line.split()
+        rows_by_length.setdefault(len(levels), []).append(levels)
+    return {length: np.array(rows, dtype=int).reshape(len(rows), length) for length, rows in rows_by_length.items()}
+
+
+def drop_one_positions(length):
+    """
+    Index table for deleting one level from a report of `length` levels: row k lists the positions left after
+    dropping level k.
+
+    Returns a 2D numpy array of shape (length, length - 1).
+    """
+    remaining = np.arange(length - 1)
+    return remaining[None, :] + (remaining[None, :] >= np.arange(length)[:, None])
+
+
+def count_safe_reports_by_length(reports_by_length, use_dampener=False, batch_size=1 << 22, long_report_length=256):
+    """
+    Count the number of safe reports in reports grouped by length (see read_input_by_length) with batched array
+    operations instead of a Python loop per report. With the Problem Dampener, every report of a length is
+    expanded into all of its single-level deletions at once (one row per dropped position), in batches of at
+    most `batch_size` expanded levels to bound memory. The expansion grows with the square of the length, so
+    unsafe reports longer than `long_report_length` go through is_report_safe_with_dampener_linear instead.
+
+    Returns the number of safe reports.
+    """
+    total = 0
+    for length, reports in reports_by_length.items():
+        safe = are_diffs_safe(reports, np.array(length))
+        if not use_dampener or length <= 2:
+            total += len(reports) if use_dampener else int(np.sum(safe))
+            continue
+
+        total += int(np.sum(safe))
+        unsafe = reports[~safe]
+        if length > long_report_length:
+            total += sum(is_report_safe_with_dampener_linear(report) for report in unsafe)
+            continue
+
+        keep = drop_one_positions(length)
+        rows = max(1, batch_size // (length * (length - 1)))
+        for start in range(0, len(unsafe), rows):
+            dropped = unsafe[start:start + rows][:, keep] # shape (reports, dropped position, remaining levels)
+            total += int(np.sum(np.any(are_diffs_safe(dropped, np.array(length - 1)), axis=1)))
+
+    return total
+
+
+def count_safe_reports_vectorized(levels, lengths, use_dampener=False, batch_size=1 << 22, long_report_length=256):
+    """
+    Count the number of safe reports in a padded array of reactor reports (see read_input_padded), by grouping
+    the rows by report length and counting them like count_safe_reports_by_length.
+
+    Returns the number of safe reports.
+    """
+    reports_by_length = {int(length): levels[lengths == length, :length] for length in np.unique(lengths)}
+    return count_safe_reports_by_length(reports_by_length, use_dampener, batch_size, long_report_length)
+
+
 if __name__ == "__main__":
-    reports = read_input("input.txt")
+    reports_by_length = read_input_by_length("input.txt")
 
     # part 1
-    print(count_safe_reports(reports, use_dampener=False))
+    print(count_safe_reports_by_length(reports_by_length, use_dampener=False))
 
     # part 2
-    print(count_safe_reports(reports, use_dampener=True))
+    print(count_safe_reports_by_length(reports_by_length, use_dampener=True))
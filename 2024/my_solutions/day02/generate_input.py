@@ -0,0 +1,49 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 1000  # number of reports
+DIMENSIONS = 1
+
+
+def generate_report(rng, min_levels=5, max_levels=8):
+    """
+    Generate a single report: a monotonic walk with steps of 1-3, with a bad level injected half of the time.
+
+    Returns a list of integer levels.
+    """
+    direction = rng.choice((-1, 1))
+    level = rng.randint(10, 90)
+    levels = [level]
+    for _ in range(rng.randint(min_levels, max_levels) - 1):
+        level += direction * rng.randint(1, 3)
+        levels.append(level)
+
+    # corrupt some reports so that both parts have something to reject
+    if rng.random() < 0.5:
+        levels[rng.randrange(len(levels))] += rng.choice((-5, -1, 0, 1, 5))
+    return levels
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, min_levels=5, max_levels=8):
+    """
+    Generate a reactor report input with `size` reports of `min_levels` to `max_levels` levels each.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    return "\n".join(
+        " ".join(map(str, generate_report(rng, min_levels, max_levels))) for _ in range(size)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day02 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of reports")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--min-levels", type=int, default=5)
+    parser.add_argument("--max-levels", type=int, default=8)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.min_levels, args.max_levels))
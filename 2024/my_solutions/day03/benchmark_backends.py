@@ -0,0 +1,70 @@
+import argparse
+import subprocess
+import sys
+import time
+
+from day03 import BACKENDS, sum_multiplications
+from generate_input import generate_input
+
+# module each backend has to import before it can run (the state machine needs none)
+BACKEND_MODULES = {"re": "re", "regex": "regex", "state_machine": None}
+
+
+def measure_import_time(module, repeats=5):
+    """
+    Time `import module` in fresh interpreters, so earlier imports in this process do not hide the cost.
+
+    Returns the fastest import time in seconds (0 if the backend needs no import).
+    """
+    if module is None:
+        return 0.0
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeats)
+    )
+
+
+def build_memory_dump(size_mb, seed=0, block_chars=1 << 20):
+    """
+    Build a memory dump of roughly `size_mb` megabytes by repeating one generated block, which is much faster
+    than generating every byte and scans the same way.
+
+    Returns the dump as a string.
+    """
+    block = generate_input(block_chars, seed)
+    return block * max(1, round(size_mb * (1 << 20) / len(block)))
+
+
+def measure_throughput(memory, backend, repeats=1):
+    """
+    Time sum_multiplications over the dump with one backend.
+
+    Returns a tuple (total, best_seconds).
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        total = sum_multiplications(memory, backend)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return total, best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare import time and throughput of the day03 backends.")
+    parser.add_argument("--size-mb", type=float, default=100, help="size of the generated memory dump")
+    parser.add_argument("-n", "--repeats", type=int, default=1, help="timed runs per backend (best is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("backends", nargs="*", default=list(BACKENDS), help="backends to compare (default: all)")
+    args = parser.parse_args()
+
+    memory = build_memory_dump(args.size_mb, args.seed)
+    megabytes = len(memory) / (1 << 20)
+    print(f"memory dump: {megabytes:.1f} MB")
+    print(f"{'backend':<14} {'import ms':>10} {'scan s':>10} {'MB/s':>10} {'total':>16}")
+
+    for backend in args.backends:
+        import_time = measure_import_time(BACKEND_MODULES[backend])
+        total, seconds = measure_throughput(memory, backend, args.repeats)
+        print(f"{backend:<14} {import_time * 1e3:>10.2f} {seconds:>10.2f} {megabytes / seconds:>10.1f} {total:>16}")
@@ -1,4 +1,6 @@
-import regex as re
+import importlib
+import mmap
+import re
 
 def read_input(input_file_dir):
     """ Parse memory instructions from the input file. """
@@ -8,7 +10,77 @@ def read_input(input_file_dir):
     return lines
 
 
-def sum_multiplications(memory):
+def iter_memory_chunks(input_file_dir, chunk_size=1 << 20):
+    """
+    Read the memory dump in pieces of `chunk_size` characters, for inputs too large to load at once.
+
+    Yields strings of up to chunk_size characters.
+    """
+    with open(input_file_dir, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+MUL_PATTERN = r"mul\s*\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)"
+
+# backends for sum_multiplications: the stdlib `re` module, the third-party `regex` module (imported only when
+# selected, so it is an optional dependency), or the hand-written scanner below
+BACKENDS = ("re", "regex", "state_machine")
+
+
+def match_multiplication(memory, i):
+    """
+    Hand-written state machine for MUL_PATTERN, started at a 'mul' at index i. It steps through the expected
+    tokens '(', number, ',', number, ')' character by character, skipping optional whitespace before each
+    token and reading 1-3 digits for each number.
+
+    Returns a tuple (x, y, end) with the operand strings and the index after the ')', or None if the
+    instruction is invalid.
+    """
+    length = len(memory)
+    j = i + 3
+    operands = []
+    for token in ("(", None, ",", None, ")"): # None stands for a number
+        while j < length and memory[j].isspace():
+            j += 1
+        if token is None:
+            start = j
+            while j < length and j - start < 3 and memory[j].isdecimal():
+                j += 1
+            if j == start:
+                return None
+            operands.append(memory[start:j])
+        else:
+            if j >= length or memory[j] != token:
+                return None
+            j += 1
+    return operands[0], operands[1], j
+
+
+def find_multiplications_state_machine(memory):
+    """
+    Find the same instructions as MUL_PATTERN without a regex engine: `str.find` jumps to each 'mul' and
+    match_multiplication checks the rest. Like the regex, scanning resumes after a match, or one character
+    after a failed 'mul'.
+
+    Returns a list of (x, y) operand string pairs, like re.findall.
+    """
+    matches = []
+    i = memory.find("mul")
+    while i != -1:
+        match = match_multiplication(memory, i)
+        if match is None:
+            i = memory.find("mul", i + 1)
+        else:
+            matches.append(match[:2])
+            i = memory.find("mul", match[2])
+    return matches
+
+
+def sum_multiplications(memory, backend="re"):
     """ 
     Extract and sum the results of valid multiplication instructions from corrupted memory.
 
@@ -19,14 +91,17 @@ def sum_multiplications(memory):
     - `(\d{1,3})`: Captures 1-3 digit numbers
     - `\s*,\s*`: Allows whitespace around the comma
     - `\s*\)`: Allows whitespace before closing parenthesis
-    """
-    # Use regex to find valid mul instructions
-    pattern = r"mul\s*\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)"
-    # pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
 
+    backend: 're' (stdlib, default), 'regex' (third-party module) or 'state_machine' (hand-written scanner)
+    """
     # Find all matches
     memory_string = ''.join(memory) # Convert list of strings to single string
-    matches = re.findall(pattern, memory_string)
+    if backend == "state_machine":
+        matches = find_multiplications_state_machine(memory_string)
+    elif backend in BACKENDS:
+        matches = importlib.import_module(backend).findall(MUL_PATTERN, memory_string)
+    else:
+        raise ValueError(f"invalid backend: {backend}")
     
     # Calculate and sum the results of valid mul instructions
     total = sum(int(x) * int(y) for x, y in matches)
@@ -34,6 +109,119 @@ def sum_multiplications(memory):
     return total
 
 
+# text that can still grow into an instruction matching MUL_PATTERN: 'mul' followed by any leading part of the
+# rest of the pattern short of the closing ')'
+MUL_PREFIX_PATTERN = r"mul\s*(?:\(\s*(?:\d{1,3}\s*(?:,\s*(?:\d{1,3}\s*)?)?)?)?"
+
+
+def iter_multiplication_operands(chunks):
+    """
+    Find valid multiplication instructions in memory that arrives in chunks (e.g. from iter_memory_chunks).
+    An instruction can straddle two chunks, so the text from the last 'mul' of a chunk onwards is carried over
+    to the next chunk while it can still become an instruction (see MUL_PREFIX_PATTERN); otherwise only the
+    last two characters (or what follows a complete instruction there) are, which could be the start of a 'mul'. An instruction only contains a single 'mul',
+    so every match before that point is complete, and the carry stays a few characters long.
+
+    Yields the operands (x, y) of each instruction as integers.
+    """
+    pattern = re.compile(MUL_PATTERN)
+    prefix_pattern = re.compile(MUL_PREFIX_PATTERN)
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk
+        cut = max(len(buffer) - 2, 0)
+        last_mul = buffer.rfind("mul")
+        if last_mul != -1:
+            if prefix_pattern.fullmatch(buffer, last_mul):
+                cut = last_mul
+            elif match := pattern.match(buffer, last_mul): # a complete instruction close to the end
+                cut = max(cut, match.end())
+        for match in pattern.finditer(buffer, 0, cut):
+            yield int(match.group(1)), int(match.group(2))
+        carry = buffer[cut:]
+    for match in pattern.finditer(carry):
+        yield int(match.group(1)), int(match.group(2))
+
+
+def sum_multiplications_streaming(input_file_dir, chunk_size=1 << 20):
+    """
+    Calculate the same total as sum_multiplications while reading the file in chunks, so memory use does not
+    grow with the size of the dump.
+
+    Returns the total sum of all valid multiplication results.
+    """
+    return sum(x * y for x, y in iter_multiplication_operands(iter_memory_chunks(input_file_dir, chunk_size)))
+
+
+# one pattern for every instruction: a multiplication (with its operands captured), do() or don't()
+INSTRUCTION_PATTERN = rb"mul\s*\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)|do\(\)|don't\(\)"
+
+
+def find_safe_cut(memory, start, end):
+    """
+    Find where to stop scanning a window memory[start:end] when more data follows. Every instruction begins
+    with 'mul' or 'do' and contains no other occurrence of them, so matches that start before the last
+    'mul'/'do' of the window are complete. The window may also end with the first few bytes of an instruction
+    ('m', 'mu', 'd', "don'", ...), which are left for the next window too.
+
+    Returns the position from which scanning must continue with the next window.
+    """
+    cut = end
+    for prefix in (b"mul", b"do"):
+        index = memory.rfind(prefix, start, end)
+        if index != -1:
+            cut = min(cut, index)
+    for i in range(max(start, end - 6), end):
+        tail = memory[i:end]
+        if b"mul".startswith(tail) or b"don't()".startswith(tail):
+            return min(cut, i)
+    return cut
+
+
+def scan_memory_file(input_file_dir, chunk_size=1 << 24):
+    """
+    Calculate both totals (all multiplications, and only the ones enabled by do()/don't()) in a single pass
+    over a memory-mapped file. A combined pattern matches every instruction in file order, so the do()/don't()
+    state is tracked on the fly. The file is scanned in windows of `chunk_size` bytes; an instruction that
+    straddles a window boundary is picked up by the next window (see find_safe_cut).
+
+    Returns a tuple (total, active_total).
+    """
+    pattern = re.compile(INSTRUCTION_PATTERN)
+    total = active_total = 0
+    enabled = True
+
+    with open(input_file_dir, "rb") as f:
+        if f.seek(0, 2) == 0: # an empty file cannot be mapped
+            return 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            size = len(memory)
+            start = 0
+            window = chunk_size
+            while start < size:
+                end = min(size, start + window)
+                cut = end if end == size else find_safe_cut(memory, start, end)
+                if cut <= start: # window too small to hold a whole instruction, widen it
+                    window *= 2
+                    continue
+
+                for match in pattern.finditer(memory, start, cut):
+                    token = match.group(0)
+                    if token == b"do()":
+                        enabled = True
+                    elif token == b"don't()":
+                        enabled = False
+                    else:
+                        product = int(match.group(1)) * int(match.group(2))
+                        total += product
+                        if enabled:
+                            active_total += product
+                start = cut
+                window = chunk_size
+
+    return total, active_total
+
+
 def remove_inactive_memory(memory):
     """
     Filter out multiplication instructions based on the 'do()' and 'don't()' activation rules.
@@ -55,10 +243,11 @@ def sum_active_multiplications(memory):
 
 
 if __name__ == "__main__":
-    memory = read_input("input.txt")
+    # parts 1 and 2 in one pass over the file
+    total, active_total = scan_memory_file("input.txt")
 
     # part 1
-    print(sum_multiplications(memory))
+    print(total)
 
     # part 2
-    print(sum_active_multiplications(memory))
+    print(active_total)
@@ -0,0 +1,46 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 18000  # approximate number of characters
+DIMENSIONS = 1
+
+NOISE = "abcdefghijklmnopqrstuvwxyz !@#$%^&*()[]{}<>,;:'?+-_/~ 0123456789"
+DECOYS = ["mul(", "mul[3,4]", "mul(4*", "mul ( 2 , 4 )", "mul(1234,5)", "do(", "don't", "why()", "from()", "select(12,3)"]
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None):
+    """
+    Generate a corrupted memory dump of roughly `size` characters containing valid `mul(X,Y)`
+    instructions, `do()` / `don't()` toggles and near-miss decoys in random noise.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.35:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.40:
+            token = "do()"
+        elif roll < 0.45:
+            token = "don't()"
+        elif roll < 0.55:
+            token = rng.choice(DECOYS)
+        else:
+            token = "".join(rng.choices(NOISE, k=rng.randint(1, 8)))
+        parts.append(token)
+        length += len(token)
+    return "".join(parts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day03 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="approximate number of characters")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed))
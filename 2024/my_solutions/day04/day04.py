@@ -1,3 +1,5 @@
+import numpy as np
+
 def read_input(input_file_dir):
     """ 
     Read a grid of characters from a text file.
@@ -10,6 +12,168 @@ def read_input(input_file_dir):
     return grid
 
 
+def build_automaton(words):
+    """
+    Build an Aho-Corasick automaton that finds every occurrence of several words in one pass over a string.
+
+    Returns a tuple (goto, fail, output):
+    - goto: a list of dicts, one per state, mapping a character to the next state of the trie
+    - fail: the state to fall back to when no trie edge matches
+    - output: the indices of the words that end in each state (including via fail links)
+    """
+    goto, fail, output = [{}], [0], [[]]
+    for index, word in enumerate(words):
+        state = 0
+        for char in word:
+            if char not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state].append(index)
+
+    # breadth-first over the trie: a state's fail link is the longest proper suffix that is also in the trie
+    queue = list(goto[0].values())
+    for state in queue:
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0) if state else 0 # depth-1 states fall back to the root
+            output[child] = output[child] + output[fail[child]]
+
+    return goto, fail, output
+
+
+def count_words_in_line(automaton, line, counts):
+    """
+    Run the automaton over a line and add the number of occurrences of each word to `counts` (indexed like
+    the words the automaton was built from).
+    """
+    goto, fail, output = automaton
+    state = 0
+    for char in line:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        for index in output[state]:
+            counts[index] += 1
+
+
+def grid_lines(grid):
+    """
+    Read the grid along every straight line: rows, columns, diagonals (down-right) and anti-diagonals
+    (down-left), each in both directions, which together cover all 8 orientations.
+
+    Yields each line as a string.
+    """
+    rows, cols = len(grid), len(grid[0])
+    lines = list(grid)
+    lines += ["".join(grid[r][c] for r in range(rows)) for c in range(cols)]
+    lines += ["".join(grid[r][r - d] for r in range(max(0, d), min(rows, cols + d))) for d in range(-(cols - 1), rows)]
+    lines += ["".join(grid[r][s - r] for r in range(max(0, s - cols + 1), min(rows, s + 1))) for s in range(rows + cols - 1)]
+    for line in lines:
+        yield line
+        yield line[::-1]
+
+
+def count_cells(array, cells):
+    """
+    Count the placements of a pattern given as cells (row offset, column offset, character code) in a grid of
+    character codes, with one shifted-slice comparison per cell. Offsets may be negative.
+
+    Returns the number of placements where every cell matches.
+    """
+    rows, cols = array.shape
+    if not cells:
+        return 0
+    min_dr, min_dc = min(dr for dr, _, _ in cells), min(dc for _, dc, _ in cells)
+    height = max(dr for dr, _, _ in cells) - min_dr + 1
+    width = max(dc for _, dc, _ in cells) - min_dc + 1
+    if height > rows or width > cols:
+        return 0
+    mask = np.ones((rows - height + 1, cols - width + 1), dtype=bool)
+    for dr, dc, code in cells:
+        dr, dc = dr - min_dr, dc - min_dc
+        mask &= array[dr:rows - height + 1 + dr, dc:cols - width + 1 + dc] == code
+    return int(np.count_nonzero(mask))
+
+
+def count_stencil(array, stencil, wildcard="."):
+    """
+    Count the placements of a 2D stencil (a list of equal-length strings, `wildcard` matching any character)
+    in a grid of character codes.
+
+    Returns the number of placements where every stencil cell matches.
+    """
+    return count_cells(array, [(dr, dc, ord(char)) for dr, line in enumerate(stencil)
+                               for dc, char in enumerate(line) if char != wildcard])
+
+
+def count_word(array, word):
+    """
+    Count a word in a grid of character codes once per orientation it reads in (8 directions), each direction
+    being a straight-line pattern for count_cells.
+
+    Returns the number of occurrences.
+    """
+    return sum(count_cells(array, [(k * dr, k * dc, ord(char)) for k, char in enumerate(word)])
+               for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+
+
+def search_grid(grid, words=(), stencils=(), wildcard=".", engine="masks"):
+    """
+    Count several searches over a grid (list of strings) at once:
+    - words: each word is counted once per orientation it reads in (8 directions, like 'XMAS').
+    - stencils: 2D patterns (lists of equal-length strings, `wildcard` matching any character), counted at
+      every placement where all their cells match.
+
+    engine selects how words are counted:
+    - 'masks' (default): shifted-slice comparisons over the whole grid, one pass per word and direction.
+    - 'automaton': a single Aho-Corasick pass over every row, column and diagonal for all words together,
+      which only pays off for many words.
+
+    Returns a dict mapping each word and each stencil (as a '/'-joined string) to its number of matches.
+    """
+    if engine not in ("masks", "automaton"):
+        raise ValueError(f"invalid engine: {engine}")
+    words = list(words)
+    array = None
+    if stencils or (words and engine == "masks"):
+        # 32-bit code points so that any characters can be compared
+        text = "".join(grid)
+        array = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).reshape(len(grid), len(grid[0]))
+
+    if engine == "automaton":
+        word_counts = [0] * len(words)
+        if words:
+            automaton = build_automaton(words)
+            for line in grid_lines(grid):
+                count_words_in_line(automaton, line, word_counts)
+    else:
+        word_counts = [count_word(array, word) for word in words]
+
+    results = {}
+    for word, count in zip(words, word_counts):
+        results[word] = results.get(word, 0) + count
+
+    for stencil in stencils:
+        results["/".join(stencil)] = count_stencil(array, stencil, wildcard)
+
+    return results
+
+
+# the two puzzle searches as presets of search_grid
+PRESETS = {
+    # 'XMAS' in any orientation
+    "XMAS": {"words": ["XMAS"]},
+    # two 'MAS' forming an X, in each of its four rotations
+    "X-MAS": {"stencils": [["M.S", ".A.", "M.S"], ["M.M", ".A.", "S.S"], ["S.M", ".A.", "S.M"], ["S.S", ".A.", "M.M"]]},
+}
+
+
 def find_occurrences(grid, mode="XMAS"):
     """
     Find occurrences in the grid.
@@ -17,54 +181,78 @@ def find_occurrences(grid, mode="XMAS"):
     - "XMAS": Find all occurrences of 'XMAS' in any orientation.
     - "X-MAS": Find all 'X-MAS' patterns (two MAS or SAM forming an X).
     """
-    rows, cols = len(grid), len(grid[0])
-    total_occurrences = 0
+    if mode not in PRESETS:
+        return 0
+    return sum(search_grid(grid, **PRESETS[mode]).values())
+
+
+def grid_to_array(grid):
+    """
+    Convert a grid (list of equal-length strings) into a 2D numpy array of character codes.
+
+    Returns a uint8 array of shape (rows, columns).
+    """
+    return np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8).reshape(len(grid), len(grid[0]))
+
+
+def shifted(array, row_start, row_stop, col_start, col_stop, dr, dc, k):
+    """ View of array[row_start:row_stop, col_start:col_stop] moved k steps in direction (dr, dc). """
+    return array[row_start + k * dr:row_stop + k * dr, col_start + k * dc:col_stop + k * dc]
+
+
+def find_occurrences_vectorized(grid, mode="XMAS"):
+    """
+    Find occurrences in the grid like find_occurrences, with one boolean mask per direction built from shifted
+    slices of the whole grid instead of a Python loop over every cell. `grid` is a list of strings or a
+    uint8 array from grid_to_array.
+    Modes:
+    - "XMAS": Find all occurrences of 'XMAS' in any orientation.
+    - "X-MAS": Find all 'X-MAS' patterns (two MAS or SAM forming an X).
+    """
+    array = grid if isinstance(grid, np.ndarray) else grid_to_array(grid)
+    rows, cols = array.shape
+    M, A, S, X = (ord(char) for char in "MASX")
 
-    # Mode: "XMAS" - Find all occurrences of 'XMAS' in any direction
     if mode == "XMAS":
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] != "X": # Skip if the character is not 'X'
+        word = [X, M, A, S]
+        span = len(word) - 1
+        total_occurrences = 0
+        for dr in [-1, 0, 1]:
+            for dc in [-1, 0, 1]:
+                if dr == dc == 0:
                     continue
-
-                # Check all possible directions (diagonal, vertical, and horizontal)
-                for dr in [-1, 0, 1]: # Direction for rows: -1 (up), 0 (same row), 1 (down)
-                    for dc in [-1, 0, 1]: # Direction for columns: -1 (left), 0 (same column), 1 (right)
-                        if dr == dc == 0: # Skip the direction where both dr and dc are 0 (no movement)
-                            continue
-
-                        # Ensure the next coordinates are within bounds
-                        if not (0 <= r + 3 * dr < len(grid) and 0 <= c + 3 * dc < len(grid[0])): 
-                            continue
-
-                        # Check if the pattern 'XMAS' exists in this direction
-                        if grid[r + dr][c + dc] == "M" and grid[r + 2 * dr][c + 2 * dc] == "A" and grid[r + 3 * dr][c + 3 * dc] == "S":
-                            total_occurrences += 1                   
-
-    # Mode: "X-MAS" - Find all 'X-MAS' patterns (two MAS or SAM forming an X)
-    elif mode == "X-MAS":
-        for r in range(1, rows - 1):  # Exclude the first and last row to avoid out-of-bounds
-            for c in range(1, cols - 1):  # Exclude the first and last column
-                if grid[r][c] != "A": # Skip if the character is not 'A'
+                # origins for which the whole word stays inside the grid
+                row_start, row_stop = max(0, -span * dr), rows - max(0, span * dr)
+                col_start, col_stop = max(0, -span * dc), cols - max(0, span * dc)
+                if row_start >= row_stop or col_start >= col_stop:
                     continue
+                mask = shifted(array, row_start, row_stop, col_start, col_stop, dr, dc, 0) == word[0]
+                for k in range(1, len(word)):
+                    mask &= shifted(array, row_start, row_stop, col_start, col_stop, dr, dc, k) == word[k]
+                total_occurrences += int(np.count_nonzero(mask))
+        return total_occurrences
 
-                # Check the four corners around the 'A'
-                corners = [grid[r - 1][c - 1], grid[r - 1][c + 1], grid[r + 1][c + 1], grid[r + 1][c - 1]]
-
-                # If the corners match one of the valid X-MAS patterns, increment the occurrence count
-                if "".join(corners) in ["MMSS", "MSSM", "SSMM", "SMMS"]:
-                    total_occurrences += 1
+    if mode == "X-MAS":
+        if rows < 3 or cols < 3:
+            return 0
+        center = array[1:-1, 1:-1]
+        upper_left, upper_right = array[:-2, :-2], array[:-2, 2:]
+        lower_right, lower_left = array[2:, 2:], array[2:, :-2]
+        # each diagonal through the 'A' must read MAS or SAM
+        diagonal = ((upper_left == M) & (lower_right == S)) | ((upper_left == S) & (lower_right == M))
+        anti_diagonal = ((upper_right == M) & (lower_left == S)) | ((upper_right == S) & (lower_left == M))
+        return int(np.count_nonzero((center == A) & diagonal & anti_diagonal))
 
-    return total_occurrences
+    return 0
 
 
 if __name__ == "__main__":
-    word_search = read_input("input.txt")
+    word_search = grid_to_array(read_input("input.txt"))
 
     # part 1
-    part_1_result = find_occurrences(word_search, mode="XMAS")
+    part_1_result = find_occurrences_vectorized(word_search, mode="XMAS")
     print(f"Total 'XMAS' occurrences: {part_1_result}")
 
     # part 2
-    part_2_result = find_occurrences(word_search, mode="X-MAS")
+    part_2_result = find_occurrences_vectorized(word_search, mode="X-MAS")
     print(f"Total 'X-MAS' occurrences: {part_2_result}")
@@ -0,0 +1,26 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 140  # side length of the square grid
+DIMENSIONS = 2
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None):
+    """
+    Generate a `size` x `size` word search grid over the letters X, M, A and S.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices("XMAS", k=size)) for _ in range(size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day04 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="side length of the grid")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed))
@@ -1,5 +1,7 @@
 import functools
 
+import numpy as np
+
 def read_input(input_file_dir):
     """
     Parse the input text to extract page ordering rules and update lists.
@@ -27,6 +29,36 @@ def read_input(input_file_dir):
     return rules, updates
 
 
+def read_rules(input_file_dir):
+    """
+    Read only the page ordering rules at the top of the input file.
+
+    Returns a list of rules as pairs of page numbers.
+    """
+    rules = []
+    with open(input_file_dir, 'r') as file:
+        for line in file:
+            if not line.strip():
+                break
+            rules.append(list(map(int, line.split("|"))))
+    return rules
+
+
+def iter_updates(input_file_dir):
+    """
+    Parse the update lists after the rules one line at a time, for inputs too large to load at once.
+
+    Yields each update as a list of page numbers.
+    """
+    with open(input_file_dir, 'r') as file:
+        for line in file: # skip the rules
+            if not line.strip():
+                break
+        for line in file:
+            if line.strip():
+                yield list(map(int, line.split(',')))
+
+
 def is_valid_order(update, rules):
     """
     Check if an update list respects the ordering rules.
@@ -87,27 +119,129 @@ def reorder_update(update, rules):
     return sorted(update, key=functools.cmp_to_key(comparator))
 
 
-def calc_middle_pages(rules, updates, process_valid_updates=True):
+class RuleSet:
+    """
+    Page ordering rules indexed once by page number, so that many updates can be checked and reordered
+    without rebuilding a lookup table per update.
+    """
+
+    def __init__(self, rules):
+        # successors[x] holds every page y with a rule x|y (x must come before y), predecessors[y] every such x
+        self.successors = {}
+        self.predecessors = {}
+        for x, y in rules:
+            if x not in self.successors:
+                self.successors[x] = set()
+            self.successors[x].add(y)
+            if y not in self.predecessors:
+                self.predecessors[y] = set()
+            self.predecessors[y].add(x)
+        self._matrix = None
+
+    def must_precede(self, a, b):
+        """ Returns True if a rule says page a must come before page b. """
+        return a in self.successors and b in self.successors[a]
+
+    def is_valid_order(self, update, adjacent_only=False):
+        """
+        Check if an update list respects the ordering rules, using the position of each page in the update
+        and only the rules between pages of the update (its successors that are in the update), so the cost
+        depends on the update length and not on the number of rules.
+
+        With adjacent_only=True only neighbouring pages are compared, which is O(k) and exact when the rules
+        totally order the pages of every update (as they do in the puzzle input).
+
+        Returns True if the update list is valid, False otherwise.
+        """
+        if adjacent_only:
+            return not any(self.must_precede(b, a) for a, b in zip(update, update[1:]))
+
+        position = {page: i for i, page in enumerate(update)}
+        pages = set(position)
+        for i, page in enumerate(update):
+            # intersecting two sets walks the smaller one, so this is bounded by the update length
+            for later in self.successors.get(page, set()) & pages:
+                if position[later] < i: # a page that must come after this one appears before it
+                    return False
+        return True
+
+    def reorder(self, update):
+        """
+        Sort an update list using the ordering rules.
+
+        Returns a new list with the elements sorted according to the rules.
+        """
+        def comparator(a, b):
+            if self.must_precede(a, b):
+                return -1  # a must come before b
+            if self.must_precede(b, a):
+                return 1   # b must come before a
+            return 0       # no specific ordering
+
+        return sorted(update, key=functools.cmp_to_key(comparator))
+
+    def middle_page(self, update):
+        """
+        Find the middle page of the reordered update without sorting it: when the rules totally order the
+        update (as in the puzzle input), the middle page is the one with exactly len(update) // 2 other pages
+        that must precede it. Falls back to a full reorder if no page qualifies.
+
+        Returns the middle page of the reordered update.
+        """
+        pages = set(update)
+        middle = len(update) // 2
+        for page in update:
+            if len(self.predecessors.get(page, set()) & pages) == middle:
+                return page
+        return self.reorder(update)[middle]
+
+    def relation_matrix(self):
+        """
+        Build (once) a boolean matrix indexed by page numbers where matrix[x, y] is True if x must come before y.
+
+        Returns the matrix as a 2D numpy array.
+        """
+        if self._matrix is None:
+            pages = set(self.successors) | set(self.predecessors)
+            size = max(pages) + 1 if pages else 0
+            self._matrix = np.zeros((size, size), dtype=bool)
+            for x, later in self.successors.items():
+                self._matrix[x, list(later)] = True
+        return self._matrix
+
+
+def calc_middle_pages(rules, updates, process_valid_updates=True, adjacent_only=False, count_middle=False):
     """
     Calculate the sum of middle pages of all updates that respect the ordering rules.
 
+    rules: a list of rule pairs or a prebuilt RuleSet; a list is indexed once for all updates.
+
     process_valid_updates (bool): 
         - True: Only consider correctly ordered updates (Part 1)
         - False: Only consider incorrectly ordered updates and reorder them before processing (Part 2)
+
+    adjacent_only (bool): only compare neighbouring pages when checking an update (see RuleSet.is_valid_order)
+
+    count_middle (bool): find the middle page of a reordered update by counting predecessors instead of sorting
+    (see RuleSet.middle_page)
     """
+    rule_set = rules if isinstance(rules, RuleSet) else RuleSet(rules)
     total = 0
     
     # Check each update
     for update in updates:
 
         # Check if the update's order matches the desired condition
-        is_currently_valid = is_valid_order(update, rules)
+        is_currently_valid = rule_set.is_valid_order(update, adjacent_only)
         
         # Determine if we should process this update
         if is_currently_valid == process_valid_updates:
             # If processing incorrectly ordered updates, reorder
             if not process_valid_updates:
-                update = reorder_update(update, rules)
+                if count_middle:
+                    total += rule_set.middle_page(update)
+                    continue
+                update = rule_set.reorder(update)
             
             # Find middle page
             middle_index = len(update) // 2
@@ -116,11 +250,56 @@ def calc_middle_pages(rules, updates, process_valid_updates=True):
     return total
 
 
+def calc_middle_pages_vectorized(rules, updates, process_valid_updates=True):
+    """
+    Calculate the same sum as calc_middle_pages with numpy, one batch per update length. For a batch of updates
+    the rule relation between every pair of pages is looked up at once: an update is valid if no page must come
+    before an earlier page, and the middle page of a reordered update is the page with exactly len // 2
+    predecessors in it (exact when the rules totally order each update, see RuleSet.middle_page).
+
+    Returns the sum of the selected middle pages.
+    """
+    rule_set = rules if isinstance(rules, RuleSet) else RuleSet(rules)
+    matrix = rule_set.relation_matrix()
+
+    # pages without any rule are never constrained, give them an empty row/column
+    max_page = max((max(update) for update in updates if update), default=0)
+    if max_page >= len(matrix):
+        matrix = np.pad(matrix, (0, max_page + 1 - len(matrix)))
+
+    by_length = {}
+    for update in updates:
+        if update:
+            by_length.setdefault(len(update), []).append(update)
+
+    total = 0
+    for length, batch in by_length.items():
+        pages = np.array(batch)
+        # before[n, a, b] is True if page a of update n must come before its page b
+        before = matrix[pages[:, :, None], pages[:, None, :]]
+        later_first = np.tril(np.ones((length, length), dtype=bool), -1) # a comes after b in the update
+        valid = ~np.any(before & later_first, axis=(1, 2))
+        middle = length // 2
+
+        if process_valid_updates:
+            total += int(pages[valid, middle].sum())
+            continue
+
+        invalid = pages[~valid]
+        is_middle = before[~valid].sum(axis=1) == middle # pages with exactly `middle` predecessors
+        found = is_middle.any(axis=1)
+        total += int(invalid[found, is_middle[found].argmax(axis=1)].sum())
+        total += sum(rule_set.reorder(update)[middle] for update in invalid[~found].tolist())
+
+    return total
+
+
 if __name__ == "__main__":
     rules, updates = read_input("input.txt")
+    rule_set = RuleSet(rules)
 
     # part 1
-    print(calc_middle_pages(rules, updates))
+    print(calc_middle_pages(rule_set, updates))
 
     # part 2
-    print(calc_middle_pages(rules, updates, process_valid_updates=False))
+    print(calc_middle_pages(rule_set, updates, process_valid_updates=False, count_middle=True))
@@ -0,0 +1,47 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 200  # number of updates
+DIMENSIONS = 1
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, pages=49, min_length=5, max_length=23):
+    """
+    Generate a page ordering input: a rule for every pair of `pages` distinct page numbers (taken from one
+    hidden total order) followed by `size` updates of odd length, about half of them correctly ordered.
+
+    Returns the input file contents as a string.
+    """
+    if pages < min_length:
+        raise ValueError(f"need at least {min_length} pages for updates of length {min_length}, got {pages}")
+
+    rng = random.Random(seed)
+    order = rng.sample(range(10, 10 + max(pages, 90)), pages)
+
+    rules = [f"{order[i]}|{order[j]}" for i in range(pages) for j in range(i + 1, pages)]
+    rng.shuffle(rules)
+
+    max_length = min(max_length, pages)
+    max_length -= 1 - max_length % 2  # largest odd length that fits in the available pages
+    rank = {page: i for i, page in enumerate(order)}
+    updates = []
+    for _ in range(size):
+        length = min(rng.randrange(min_length, max_length + 1) | 1, max_length)  # odd so that there is a middle page
+        update = rng.sample(order, length)
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day05 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of updates")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--pages", type=int, default=49, help="number of distinct page numbers")
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.pages))
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 def read_input(input_file_dir):
     """
     Read the input map from a text file.
@@ -119,6 +121,279 @@ def find_obstruction_positions(grid):
     return len(valid_positions)
 
 
+# directions in clockwise order, so turning right is (direction + 1) % 4
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)] # up, right, down, left
+
+
+def find_guard_start(grid):
+    """
+    Locate the guard ('^') on the map.
+
+    Returns a tuple (row, column) of the guard's starting position.
+    """
+    for r, row in enumerate(grid):
+        for c, char in enumerate(row):
+            if char == "^":
+                return r, c
+    raise ValueError("guard not found")
+
+
+def build_jump_table(grid):
+    """
+    Precompute, for every cell and direction, the cell where the guard stops before the next obstruction.
+
+    Returns a flat list indexed by (r * cols + c) * 4 + direction holding the flat index (r * cols + c) of the
+    stopping cell, or -1 if the guard walks off the map in that direction.
+    """
+    rows, cols = len(grid), len(grid[0])
+    jumps = [-1] * (rows * cols * 4)
+
+    for r in range(rows):
+        for c in range(cols):
+            # up: depends on the cell above, sweep rows top to bottom
+            if r > 0:
+                jumps[(r * cols + c) * 4] = r * cols + c if grid[r - 1][c] == "#" else jumps[((r - 1) * cols + c) * 4]
+            # left: depends on the cell to the left, sweep columns left to right
+            if c > 0:
+                jumps[(r * cols + c) * 4 + 3] = r * cols + c if grid[r][c - 1] == "#" else jumps[(r * cols + c - 1) * 4 + 3]
+
+    for r in range(rows - 1, -1, -1):
+        for c in range(cols - 1, -1, -1):
+            # down: depends on the cell below, sweep rows bottom to top
+            if r < rows - 1:
+                jumps[(r * cols + c) * 4 + 2] = r * cols + c if grid[r + 1][c] == "#" else jumps[((r + 1) * cols + c) * 4 + 2]
+            # right: depends on the cell to the right, sweep columns right to left
+            if c < cols - 1:
+                jumps[(r * cols + c) * 4 + 1] = r * cols + c if grid[r][c + 1] == "#" else jumps[(r * cols + c + 1) * 4 + 1]
+
+    return jumps
+
+
+def trace_guard_route(grid, start_r, start_c):
+    """
+    Walk the guard's original route and record, for every cell it enters, the state just before it first
+    steps onto that cell.
+
+    Returns a list of tuples (row, column, previous_row, previous_column, direction) in route order,
+    excluding the guard's starting cell.
+    """
+    rows, cols = len(grid), len(grid[0])
+    r, c, direction = start_r, start_c, 0
+    seen = {(r, c)}
+    route = []
+
+    while True:
+        dr, dc = DIRECTIONS[direction]
+        next_r, next_c = r + dr, c + dc
+        if next_r < 0 or next_r >= rows or next_c < 0 or next_c >= cols:
+            return route
+        if grid[next_r][next_c] == "#":
+            direction = (direction + 1) % 4
+            continue
+        if (next_r, next_c) not in seen:
+            seen.add((next_r, next_c))
+            route.append((next_r, next_c, r, c, direction))
+        r, c = next_r, next_c
+
+
+def detect_loop_with_jumps(jumps, cols, position, direction, obstruction, visited=None, generation=1):
+    """
+    Detect a loop by jumping from stop to stop with the precomputed jump table. The extra `obstruction`
+    (a flat cell index) is not in the table, so each jump checks whether it cuts the straight run short.
+
+    Visited states are marked with `generation` in the `visited` state store (see new_state_store),
+    a fresh one is allocated if none is given.
+
+    Returns True if the guard loops, False if they leave the map.
+    """
+    obstruction_r, obstruction_c = divmod(obstruction, cols)
+    if visited is None:
+        visited = new_state_store(len(jumps) // 4)
+
+    while True:
+        r, c = divmod(position, cols)
+        target = jumps[position * 4 + direction]
+
+        # does the new obstruction lie between the guard and the stop from the table?
+        if direction == 0 and obstruction_c == c and obstruction_r < r and (target == -1 or obstruction_r >= target // cols):
+            target = obstruction + cols
+        elif direction == 1 and obstruction_r == r and obstruction_c > c and (target == -1 or obstruction_c <= target % cols):
+            target = obstruction - 1
+        elif direction == 2 and obstruction_c == c and obstruction_r > r and (target == -1 or obstruction_r <= target // cols):
+            target = obstruction - cols
+        elif direction == 3 and obstruction_r == r and obstruction_c < c and (target == -1 or obstruction_c >= target % cols):
+            target = obstruction + 1
+
+        if target == -1:
+            # guard walks off the map
+            return False
+
+        # guard stops in front of an obstruction and turns right
+        position = target
+        direction = (direction + 1) % 4
+        state = position * 4 + direction
+        if visited[state] == generation:
+            return True
+        visited[state] = generation
+
+
+def count_looping_candidates(jumps, cols, candidates):
+    """
+    Count the candidate obstructions that make the guard loop. Each candidate is a tuple
+    (obstruction, position, direction) of flat indices: the loop check starts from the state just
+    before the guard would first have entered the obstructed cell.
+
+    Returns the number of candidates that cause a loop.
+    """
+    visited = new_state_store(len(jumps) // 4)
+    loops = 0
+    for generation, (obstruction, position, direction) in enumerate(candidates):
+        generation = next_generation(visited, generation)
+        loops += detect_loop_with_jumps(jumps, cols, position, direction, obstruction, visited, generation)
+    return loops
+
+
+def new_state_store(cells):
+    """
+    Allocate a visited-state store with one byte per (cell, direction) state, indexed by
+    (r * cols + c) * 4 + direction. Instead of clearing it between loop checks, each check marks states
+    with its own generation number (1-255), so one store is reused for every candidate obstruction.
+
+    Returns a zeroed bytearray.
+    """
+    return bytearray(cells * 4)
+
+
+def next_generation(visited, count):
+    """
+    Pick the generation number for the `count`-th loop check (0-based) that uses a state store. The store
+    is only wiped when the 255 generations a byte can hold run out.
+
+    Returns the generation number to mark states with.
+    """
+    generation = count % 255 + 1
+    if generation == 1 and count > 0:
+        visited[:] = bytes(len(visited))
+    return generation
+
+
+def flatten_grid(grid):
+    """
+    Convert the map into a flat bytes buffer indexed by r * cols + c.
+
+    Returns a tuple (cells, rows, cols) where cells is a bytearray of the map characters.
+    """
+    rows, cols = len(grid), len(grid[0])
+    return bytearray("".join("".join(row) for row in grid), "ascii"), rows, cols
+
+
+def detect_loop_flat(cells, rows, cols, position, direction, visited, generation):
+    """
+    Detect a loop by walking the guard step by step over the flat map buffer, starting at the flat cell
+    index `position` facing `direction` (0 up, 1 right, 2 down, 3 left). States are marked in the
+    preallocated `visited` store with `generation` instead of being added to a set of tuples.
+
+    Returns True if a loop is detected, False otherwise.
+    """
+    size = rows * cols
+    steps = (-cols, 1, cols, -1)
+    wall = ord("#")
+
+    while True:
+        state = position * 4 + direction
+        if visited[state] == generation:
+            return True
+        visited[state] = generation
+
+        # guard is about to leave the grid
+        if direction == 0:
+            if position < cols:
+                return False
+        elif direction == 1:
+            if position % cols == cols - 1:
+                return False
+        elif direction == 2:
+            if position + cols >= size:
+                return False
+        elif position % cols == 0:
+            return False
+
+        next_position = position + steps[direction]
+        if cells[next_position] == wall:
+            # guard hits an obstruction and turns right
+            direction = (direction + 1) % 4
+        else:
+            position = next_position
+
+
+def find_obstruction_positions_flat(grid):
+    """
+    Find all positions where placing an obstruction would cause the guard to enter a loop, walking the guard
+    step by step over a flat bytes copy of the map with one reusable state store for all loop checks.
+    Like find_obstruction_positions_on_route, only cells on the original route are tried, each starting
+    from the state just before the guard first enters the cell.
+
+    Returns the number of valid positions.
+    """
+    cells, rows, cols = flatten_grid(grid)
+    start_r, start_c = find_guard_start(grid)
+    visited = new_state_store(rows * cols)
+    wall = ord("#")
+
+    loops = 0
+    for count, (r, c, prev_r, prev_c, direction) in enumerate(trace_guard_route(grid, start_r, start_c)):
+        generation = next_generation(visited, count)
+        obstruction = r * cols + c
+        # place the obstruction, test, and remove it again
+        cells[obstruction] = wall
+        loops += detect_loop_flat(cells, rows, cols, prev_r * cols + prev_c, direction, visited, generation)
+        cells[obstruction] = ord(".")
+    return loops
+
+
+_worker_jumps = None
+_worker_cols = None
+
+
+def _init_worker(jumps, cols):
+    """ Store the jump table in a worker process so it is sent once per worker, not once per chunk. """
+    global _worker_jumps, _worker_cols
+    _worker_jumps, _worker_cols = jumps, cols
+
+
+def _count_looping_candidates_in_worker(candidates):
+    """ Process pool entry point for count_looping_candidates. """
+    return count_looping_candidates(_worker_jumps, _worker_cols, candidates)
+
+
+def find_obstruction_positions_on_route(grid, workers=1, chunk_size=512):
+    """
+    Find all positions where placing an obstruction would cause the guard to enter a loop, testing only
+    the cells on the guard's original route (an obstruction anywhere else is never reached).
+
+    Each loop check resumes from the state just before the guard would first have entered the candidate
+    cell and jumps between obstructions using a precomputed jump table. With workers > 1 the candidates
+    are split into chunks of `chunk_size` and checked in a process pool.
+
+    Returns the number of valid positions.
+    """
+    cols = len(grid[0])
+    start_r, start_c = find_guard_start(grid)
+    jumps = build_jump_table(grid)
+
+    candidates = [
+        (r * cols + c, prev_r * cols + prev_c, direction)
+        for r, c, prev_r, prev_c, direction in trace_guard_route(grid, start_r, start_c)
+    ]
+
+    if workers <= 1:
+        return count_looping_candidates(jumps, cols, candidates)
+
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(jumps, cols)) as executor:
+        return sum(executor.map(_count_looping_candidates_in_worker, chunks))
+
+
 if __name__ == "__main__":
     grid = read_input('input.txt')
 
@@ -126,4 +401,4 @@ if __name__ == "__main__":
     print(calculate_guard_visited_positions(grid))
 
     # part 2
-    print(find_obstruction_positions(grid)) # brute force solution
+    print(find_obstruction_positions_on_route(grid))
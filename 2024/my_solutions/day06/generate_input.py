@@ -0,0 +1,59 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 130  # side length of the square map
+DIMENSIONS = 2
+
+
+def guard_leaves_map(grid, r, c):
+    """
+    Walk the guard from (r, c) facing up.
+
+    Returns True if the guard walks off the map, False if their route is a loop.
+    """
+    rows, cols = len(grid), len(grid[0])
+    dr, dc = -1, 0
+    seen = set()
+    while (r, c, dr, dc) not in seen:
+        seen.add((r, c, dr, dc))
+        if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+            return True
+        if grid[r + dr][c + dc] == "#":
+            dr, dc = dc, -dr
+        else:
+            r, c = r + dr, c + dc
+    return False
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, obstacle_density=0.015):
+    """
+    Generate a `size` x `size` lab map with randomly placed obstructions and the guard ('^')
+    placed on an empty cell. Maps where the guard's route is a loop are redrawn, so like the
+    puzzle input the guard always leaves the map.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    while True:
+        grid = [["#" if rng.random() < obstacle_density else "." for _ in range(size)] for _ in range(size)]
+
+        # keep the guard away from the edge so that part 1 has a path to walk
+        margin = size // 4
+        r = rng.randrange(margin, size - margin)
+        c = rng.randrange(margin, size - margin)
+        grid[r][c] = "^"
+
+        if guard_leaves_map(grid, r, c):
+            return "\n".join("".join(row) for row in grid)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day06 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="side length of the map")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--density", type=float, default=0.015, help="fraction of cells that are obstructions")
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.density))
@@ -1,3 +1,9 @@
+import os
+import time
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
 def read_input(input_file_dir):
     """
     Read input equations from a text file.
@@ -16,6 +22,20 @@ def read_input(input_file_dir):
     return equations
 
 
+def iter_equations(input_file_dir):
+    """
+    Read input equations one line at a time, for inputs too large to load at once.
+
+    Yields tuples of a target number and an array of numbers.
+    """
+    with open(input_file_dir, 'r') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            left, right = line.split(": ")
+            yield int(left), [int(num) for num in right.split()]
+
+
 def is_equation_solvable(target, array, allow_concatenation=False):
     """
     Recursively check if the target number can be obtained by applying multiplication, addition, or concatenation to the array of numbers.
@@ -45,26 +65,207 @@ def is_equation_solvable(target, array, allow_concatenation=False):
     return False
 
     
-def sum_solvable_equation_targets(equations, allow_concatenation=False):
+# powers of ten for arithmetic concatenation checks, extended on demand for larger operands
+POWERS_OF_TEN = [10 ** k for k in range(20)]
+
+
+def next_power_of_ten(number):
+    """
+    Smallest power of ten greater than a non-negative number, i.e. the factor that shifts a value left by the
+    number's digit count when concatenating.
+
+    Returns the power of ten.
+    """
+    while number >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return POWERS_OF_TEN[bisect_right(POWERS_OF_TEN, number)]
+
+
+def undo_operations(target, operand, allow_concatenation):
+    """
+    Undo the last operation of an equation: list the values the rest of the equation must produce so that
+    applying an operator with `operand` gives `target`. Follows the same rules as is_equation_solvable.
+
+    Returns a list of candidate values.
+    """
+    values = []
+    # MULTIPLICATION: divide the target by the operand
+    if target % operand == 0:
+        values.append(target // operand)
+    # ADDITION: subtract the operand from the target
+    if target > operand:
+        values.append(target - operand)
+    # CONCATENATION: the target ends with the operand's digits and has more digits than the operand
+    if allow_concatenation:
+        shift = next_power_of_ten(operand)
+        if target >= shift and target % shift == operand:
+            values.append(target // shift)
+    return values
+
+
+def is_equation_solvable_iterative(target, array, allow_concatenation=False):
+    """
+    Check the same condition as is_equation_solvable with an explicit stack of (target, index) pairs, where
+    index points at the last operand still in play, instead of recursing on copied slices of the array.
+
+    Returns True if the target number can be obtained using the array of numbers, False otherwise.
+    """
+    stack = [(target, len(array) - 1)]
+    while stack:
+        target, index = stack.pop()
+        if index == 0:
+            if target == array[0]:
+                return True
+            continue
+        for value in undo_operations(target, array[index], allow_concatenation):
+            stack.append((value, index - 1))
+    return False
+
+
+def forward_values(array, limit, allow_concatenation):
+    """
+    Evaluate every operator combination over the array from left to right, keeping each distinct value once.
+    With positive operands no operator makes a value smaller, so values above `limit` are dropped.
+
+    Returns the set of values the array can produce (up to `limit`).
+    """
+    values = {array[0]} if array[0] <= limit else set()
+    for operand in array[1:]:
+        shift = next_power_of_ten(operand)
+        next_values = set()
+        for value in values:
+            next_values.add(value + operand)
+            next_values.add(value * operand)
+            if allow_concatenation:
+                next_values.add(value * shift + operand)
+        values = {value for value in next_values if value <= limit}
+    return values
+
+
+def backward_values(target, array, allow_concatenation):
+    """
+    Undo the operators of the array from the right, starting at the target and keeping each distinct
+    intermediate target once.
+
+    Returns the set of values that the part of the equation before `array` must produce.
+    """
+    values = {target}
+    for operand in reversed(array):
+        values = {value for target in values for value in undo_operations(target, operand, allow_concatenation)}
+    return values
+
+
+def is_equation_solvable_meet_in_the_middle(target, array, allow_concatenation=False):
+    """
+    Check the same condition as is_equation_solvable by splitting the operands in half: the left half is
+    evaluated forwards, the right half is undone backwards from the target, and the equation is solvable if
+    the two sets of values meet. Duplicate values collapse in the sets, which keeps long equations bounded.
+    Assumes positive operands, like the puzzle input.
+
+    Returns True if the target number can be obtained using the array of numbers, False otherwise.
+    """
+    split = (len(array) + 1) // 2
+    backward = backward_values(target, array[split:], allow_concatenation)
+    if not backward:
+        return False
+    forward = forward_values(array[:split], max(backward), allow_concatenation)
+    return not forward.isdisjoint(backward)
+
+
+def is_equation_solvable_fast(target, array, allow_concatenation=False, split_threshold=16):
+    """
+    Pick a solver by equation length: the iterative search for short operand lists and meet-in-the-middle
+    for lists of `split_threshold` operands or more.
+
+    Returns True if the target number can be obtained using the array of numbers, False otherwise.
+    """
+    if len(array) >= split_threshold:
+        return is_equation_solvable_meet_in_the_middle(target, array, allow_concatenation)
+    return is_equation_solvable_iterative(target, array, allow_concatenation)
+
+
+def sum_solvable_equation_targets(equations, allow_concatenation=False, solver=is_equation_solvable):
     """
     Calculate the sum of target numbers that can be obtained by applying operators to their respective number arrays.
+    `solver` is any function with the signature of is_equation_solvable (e.g. is_equation_solvable_fast).
 
     Returns the sum of the target numbers that can be obtained.
     """
     total = 0
 
     for target, array in equations:
-        if is_equation_solvable(target, array, allow_concatenation):
+        if solver(target, array, allow_concatenation):
             total += target
     
     return total
 
 
+def iter_chunks(items, chunk_size):
+    """
+    Split any iterable into lists of up to `chunk_size` items without reading it all at once.
+
+    Yields lists of items.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _sum_chunk(chunk_index, chunk, allow_concatenation, solver):
+    """ Process pool entry point: solve one chunk of equations and time it. """
+    start = time.perf_counter()
+    subtotal = sum_solvable_equation_targets(chunk, allow_concatenation, solver)
+    return chunk_index, len(chunk), subtotal, time.perf_counter() - start
+
+
+def _collect_chunks(futures, chunk_timings):
+    """ Add up finished chunk results, recording their timings if requested. """
+    total = 0
+    for future in futures:
+        chunk_index, size, subtotal, seconds = future.result()
+        total += subtotal
+        if chunk_timings is not None:
+            chunk_timings.append({"index": chunk_index, "equations": size, "subtotal": subtotal, "seconds": seconds})
+    return total
+
+
+def sum_solvable_equation_targets_parallel(equations, allow_concatenation=False, solver=is_equation_solvable_fast,
+                                           workers=None, chunk_size=10000, chunk_timings=None):
+    """
+    Calculate the same sum as sum_solvable_equation_targets, with chunks of `chunk_size` equations checked in
+    a pool of `workers` processes (default: one per CPU). Equations are read lazily from any iterable and at
+    most two chunks per worker are in flight, so results stream back as chunks finish.
+
+    If a `chunk_timings` list is given, one dict per chunk (index, equations, subtotal, seconds) is appended
+    to it in completion order.
+
+    Returns the sum of the target numbers that can be obtained.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = iter_chunks(equations, chunk_size)
+
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk_index, chunk in enumerate(chunks):
+            pending.add(executor.submit(_sum_chunk, chunk_index, chunk, allow_concatenation, solver))
+            if len(pending) < 2 * workers:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            total += _collect_chunks(done, chunk_timings)
+        total += _collect_chunks(pending, chunk_timings)
+
+    return total
+
+
 if __name__ == "__main__":
     calibration_equations = read_input("input.txt")
 
     # part 1
-    print(sum_solvable_equation_targets(calibration_equations, allow_concatenation=False))
+    print(sum_solvable_equation_targets(calibration_equations, allow_concatenation=False, solver=is_equation_solvable_fast))
 
     # part 2
-    print(sum_solvable_equation_targets(calibration_equations, allow_concatenation=True))
+    print(sum_solvable_equation_targets(calibration_equations, allow_concatenation=True, solver=is_equation_solvable_fast))
@@ -0,0 +1,45 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 850  # number of equations
+DIMENSIONS = 1
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, min_operands=3, max_operands=12):
+    """
+    Generate `size` calibration equations. Targets are built by applying random +, * and || operators
+    to the operands, and about a third of them are then nudged so they are (most likely) unsolvable.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        operands = [rng.randint(1, 999) if rng.random() < 0.3 else rng.randint(1, 99)
+                    for _ in range(rng.randint(min_operands, max_operands))]
+        target = operands[0]
+        for operand in operands[1:]:
+            op = rng.random()
+            if op < 0.45:
+                target += operand
+            elif op < 0.9:
+                target *= operand
+            else:
+                target = int(f"{target}{operand}")
+        if rng.random() < 0.33:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, operands))}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day07 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of equations")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--min-operands", type=int, default=3)
+    parser.add_argument("--max-operands", type=int, default=12)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.min_operands, args.max_operands))
@@ -1,3 +1,5 @@
+import numpy as np
+
 def read_input(input_file_dir):
     """
     Read the input grid and extract antenna positions organized by their frequency.
@@ -68,13 +70,142 @@ def count_valid_antinodes(grid, antinodes):
     return len([0 for r, c in antinodes if 0 <= r < rows and 0 <= c < cols])
 
 
+def line_steps_in_bounds(start, step, size):
+    """
+    For lines start + t * step along one axis, find the range of integers t that stay within 0..size-1
+    (start is inside the grid, so t = 0 is always in range; a zero step never leaves it).
+
+    Returns a tuple of arrays (lowest t, highest t).
+    """
+    magnitude = np.maximum(np.abs(step), 1)
+    towards_end = (size - 1 - start) // magnitude # steps possible towards size - 1
+    towards_zero = start // magnitude # steps possible towards 0
+    backwards = step < 0
+    low = -np.where(backwards, towards_end, towards_zero)
+    high = np.where(backwards, towards_zero, towards_end)
+    still = step == 0
+    low[still], high[still] = -size, size
+    return low, high
+
+
+def reduced_steps(rows, cols, dtype=np.int64):
+    """
+    Divide every offset (dr, dc) between two positions of a rows x cols board, with 0 <= dr < rows and
+    -cols < dc < cols, by the gcd of its components, so pairs of antennas look their step up instead of
+    computing a gcd each.
+
+    Returns a tuple of 2D arrays (row steps, col steps), indexed by [dr, dc + cols - 1].
+    """
+    row_offset, col_offset = np.ogrid[:rows, 1 - cols:cols]
+    divisor = np.maximum(np.gcd(row_offset, col_offset), 1)
+    return (row_offset // divisor).astype(dtype), (col_offset // divisor).astype(dtype)
+
+
+def draw_lines(board, point_rows, point_cols, row_steps, col_steps):
+    """
+    Mark whole lines on a 2D boolean board: every grid position reachable from (point_rows[k], point_cols[k])
+    in steps of (row_steps[k], col_steps[k]), in either direction. Each line is drawn from its first position
+    on the board, one step at a time; sorting the lines by length (a radix sort, as lengths fit a small
+    integer type) makes the ones still long enough at each step a suffix of the arrays.
+    """
+    rows, cols = board.shape
+    row_low, row_high = line_steps_in_bounds(point_rows, row_steps, rows)
+    col_low, col_high = line_steps_in_bounds(point_cols, col_steps, cols)
+    low = np.maximum(row_low, col_low)
+    lengths = (np.minimum(row_high, col_high) - low + 1).astype(np.min_scalar_type(max(rows, cols)))
+    order = np.argsort(lengths, kind="stable")
+    lengths, steps, low = lengths[order], (row_steps * cols + col_steps)[order], low[order]
+    origins = (point_rows * cols + point_cols)[order] + low * steps
+
+    flat = board.reshape(-1)
+    firsts = np.searchsorted(lengths, np.arange(lengths.max(initial=0), dtype=lengths.dtype), side="right")
+    for t, first in enumerate(firsts):
+        flat[origins[first:] + t * steps[first:]] = True
+
+
+# reduced steps up to this long along both axes make lines that pass through many antennas, so part 2 draws
+# those lines once per direction rather than once per pair of antennas on them
+LONG_LINE_STEP = 32
+
+
+def calculate_antinode_bitmap(grid, antennas, include_antenna_positions=False, chunk_size=1 << 20):
+    """
+    Mark antinodes on a boolean bitmap of the board with numpy, handling all pairs of antennas of one frequency
+    at once instead of one pair at a time, and never storing points outside the board. Antennas are sorted in
+    reading order and processed in blocks of rows of a (block, antennas) grid of pairs taken by broadcasting,
+    about `chunk_size` pairs at a time.
+
+    - Part 1: antinode 2 * a - b for every ordered pair (a, b). It is on the board only if b's row is within
+      2 * a's row - (rows - 1) .. 2 * a's row, so each block is only paired with that window of antennas.
+    - Part 2: every grid position exactly in line with the pair. The offset between the antennas is divided
+      by its gcd (looked up in reduced_steps), so positions between the antennas on the line are included,
+      and it points forward in reading order, so collinear pairs share a step. Lines with a step of at most
+      LONG_LINE_STEP along both axes are deduplicated before they are drawn: for each such step that occurs,
+      antennas are grouped by line (the cross product with the step) and every line holding two or more is
+      drawn once. Other lines are at most a few positions long and drawn per pair. This matches
+      calculate_antinodes whenever antenna offsets are coprime (as in the puzzle input).
+
+    Returns a 2D boolean numpy array, True at every antinode.
+    """
+    rows, cols = len(grid), len(grid[0])
+    board = np.zeros((rows, cols), dtype=bool)
+    flat = board.reshape(-1)
+    index_type = np.int32 if 4 * rows * cols < 2 ** 31 else np.int64 # flat positions, also a little off the board
+    if include_antenna_positions:
+        row_steps, col_steps = reduced_steps(rows, cols, index_type)
+
+    for array in antennas.values():
+        positions = np.array(array, dtype=index_type).reshape(-1, 2)
+        positions = positions[np.argsort(positions[:, 0] * cols + positions[:, 1])]
+        count = len(positions)
+        block = max(1, chunk_size // max(count, 1))
+        directions = np.zeros((LONG_LINE_STEP + 1, 2 * LONG_LINE_STEP + 1), dtype=bool) # (row step, col step + LONG_LINE_STEP)
+        for start in range(0, count, block):
+            stop = min(start + block, count)
+            first = positions[start:stop, None, :]
+
+            if not include_antenna_positions:
+                low = np.searchsorted(positions[:, 0], 2 * first[0, 0, 0] - (rows - 1), side="left")
+                high = np.searchsorted(positions[:, 0], 2 * first[-1, 0, 0], side="right")
+                points = 2 * first - positions[None, low:high, :]
+                inside = (points[..., 0] >= 0) & (points[..., 0] < rows) & (points[..., 1] >= 0) & (points[..., 1] < cols)
+                inside[np.arange(stop - start), np.arange(start, stop) - low] = False # an antenna with itself
+                flat[(points[..., 0] * cols + points[..., 1])[inside]] = True
+                continue
+
+            # pairs (i, j > i): the later antenna in reading order, so the step points forward
+            row_offset = positions[None, start + 1:, 0] - first[..., 0]
+            col_offset = positions[None, start + 1:, 1] - first[..., 1] + cols - 1
+            upper = np.arange(count - start - 1)[None, :] >= np.arange(stop - start)[:, None]
+            row_step, col_step = row_steps[row_offset, col_offset], col_steps[row_offset, col_offset]
+            long_line = upper & (row_step <= LONG_LINE_STEP) & (np.abs(col_step) <= LONG_LINE_STEP)
+            directions[row_step[long_line], col_step[long_line] + LONG_LINE_STEP] = True
+            pairs = upper & ~long_line
+            draw_lines(board, np.broadcast_to(first[..., 0], pairs.shape)[pairs],
+                       np.broadcast_to(first[..., 1], pairs.shape)[pairs], row_step[pairs], col_step[pairs])
+
+        steps = np.argwhere(directions)
+        lines, pending = [], 0 # (antenna index, row step, col step) of lines not drawn yet
+        for number, (row_step, col_step) in enumerate(steps, 1):
+            col_step -= LONG_LINE_STEP
+            # positions on one line with this step have the same cross product with it
+            _, index, counts = np.unique(positions[:, 0] * col_step - positions[:, 1] * row_step, return_index=True, return_counts=True)
+            index = index[counts > 1]
+            lines.append((index, np.full(len(index), row_step), np.full(len(index), col_step)))
+            pending += len(index)
+            if pending >= chunk_size or number == len(steps):
+                index, row_step, col_step = (np.concatenate(column) for column in zip(*lines))
+                draw_lines(board, positions[index, 0], positions[index, 1], row_step, col_step)
+                lines, pending = [], 0
+
+    return board
+
+
 if __name__ == "__main__":
     grid, antennas = read_input("input.txt")
 
     # part 1
-    part1_antinodes = calculate_antinodes(grid, antennas, include_antenna_positions=False)
-    print(count_valid_antinodes(grid, part1_antinodes))
+    print(int(np.count_nonzero(calculate_antinode_bitmap(grid, antennas, include_antenna_positions=False))))
 
     # part 2
-    part2_antinodes = calculate_antinodes(grid, antennas, include_antenna_positions=True)
-    print(count_valid_antinodes(grid, part2_antinodes))
+    print(int(np.count_nonzero(calculate_antinode_bitmap(grid, antennas, include_antenna_positions=True))))
@@ -0,0 +1,34 @@
+import argparse
+import random
+import string
+
+DEFAULT_SIZE = 50  # side length of the square map
+DIMENSIONS = 2
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, antenna_density=0.08):
+    """
+    Generate a `size` x `size` antenna map where a fraction `antenna_density` of the cells
+    hold an antenna of a random frequency (digits and letters).
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choice(FREQUENCIES) if rng.random() < antenna_density else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day08 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="side length of the map")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--density", type=float, default=0.08, help="fraction of cells that hold an antenna")
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.density))
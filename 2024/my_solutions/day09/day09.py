@@ -1,3 +1,5 @@
+import heapq
+
 def read_input_p1(input_file_dir):
     """
     Parse the disk map from an input file into a list of file blocks and free spaces.
@@ -61,6 +63,16 @@ def read_input_p2(input_file_dir):
     return files, blanks, fid
 
 
+def read_disk_map(input_file_dir):
+    """
+    Read the disk map as is, without expanding it into blocks.
+
+    Returns the run-length-encoded disk map: a string of digits alternating file and free space lengths.
+    """
+    with open(input_file_dir, 'r') as file:
+        return file.read().strip()
+
+
 def compact_disk_and_calculate_checksum(disk):
     """
     Compact the disk by filling free spaces with file blocks from the end of the disk, then calculate the filesystem checksum.
@@ -121,9 +133,98 @@ def compact_files_by_whole_blocks_and_calculate_checksum(files, blanks, fid):
     return checksum
 
 
+def file_checksum(fid, pos, size):
+    """
+    Checksum contribution of a file of `size` blocks starting at `pos`: fid * (pos + ... + pos + size - 1),
+    computed as an arithmetic series instead of a loop over the blocks.
+
+    Returns the checksum contribution of the file.
+    """
+    return fid * (size * pos + size * (size - 1) // 2)
+
+
+def compact_files_with_free_space_heaps(files, blanks, fid):
+    """
+    Compact the disk by moving whole files into free spaces, in decreasing file ID order, using one min-heap
+    of start positions per free space size. Placing a file only looks at the top of the heaps for sizes that
+    fit, so each move is O(log n) instead of a scan over all blanks.
+
+    Returns the computed filesystem checksum after compacting the disk.
+    """
+    max_length = max((length for _, length in blanks), default=0)
+    heaps = [[] for _ in range(max_length + 1)] # heaps[length] holds the starts of blanks of that length
+    for start, length in blanks:
+        heaps[length].append(start)
+    for heap in heaps:
+        heapq.heapify(heap)
+
+    checksum = 0
+    while fid > 0:
+        fid -= 1
+        pos, size = files[fid]
+
+        # leftmost blank that fits: the smallest start among the heaps for lengths >= size
+        best_start, best_length = pos, None
+        for length in range(size, max_length + 1):
+            heap = heaps[length]
+            if heap and heap[0] < best_start:
+                best_start, best_length = heap[0], length
+
+        if best_length is not None:
+            heapq.heappop(heaps[best_length])
+            if best_length > size: # blank still has space left
+                heapq.heappush(heaps[best_length - size], best_start + size)
+            pos = best_start
+            files[fid] = (pos, size)
+
+        checksum += file_checksum(fid, pos, size)
+
+    return checksum
+
+
+def compact_disk_map_and_calculate_checksum(disk_map):
+    """
+    Compact the disk block by block, like compact_disk_and_calculate_checksum, directly on the run-length-encoded
+    disk map. A left cursor walks the runs in order while a right cursor hands out blocks from the last file,
+    and the checksum is accumulated per run, so no block list is ever built.
+
+    Returns the computed filesystem checksum.
+    """
+    right = len(disk_map) - 1
+    if right % 2 == 1: # the map ends with free space, the last file is one run earlier
+        right -= 1
+    remaining = int(disk_map[right]) if right >= 0 else 0 # blocks of the right file not moved yet
+
+    checksum = 0
+    pos = 0
+    for i in range(len(disk_map)):
+        if i > right:
+            break
+
+        if i % 2 == 0: # file run stays in place (only its unmoved blocks if the right cursor took some)
+            size = remaining if i == right else int(disk_map[i])
+            checksum += file_checksum(i // 2, pos, size)
+            pos += size
+            continue
+
+        # free space run is filled with blocks taken from the right file
+        gap = int(disk_map[i])
+        while gap > 0 and right > i:
+            take = min(gap, remaining)
+            checksum += file_checksum(right // 2, pos, take)
+            pos += take
+            gap -= take
+            remaining -= take
+            if remaining == 0: # right file fully moved, continue with the previous file
+                right -= 2
+                remaining = int(disk_map[right]) if right > i else 0
+
+    return checksum
+
+
 if __name__ == "__main__":
     # part 1
-    print(compact_disk_and_calculate_checksum(read_input_p1('input.txt')))
+    print(compact_disk_map_and_calculate_checksum(read_disk_map('input.txt')))
 
     # part 2
-    print(compact_files_by_whole_blocks_and_calculate_checksum(*read_input_p2('input.txt')))
+    print(compact_files_with_free_space_heaps(*read_input_p2('input.txt')))
@@ -0,0 +1,30 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 19999  # number of digits in the disk map
+DIMENSIONS = 1
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None):
+    """
+    Generate a disk map of `size` digits (rounded up to an odd count so it ends with a file).
+    File lengths are 1-9 and free space lengths are 0-9. No trailing newline, like the puzzle input.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    size |= 1
+    return "".join(
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(size)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day09 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of digits")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed))
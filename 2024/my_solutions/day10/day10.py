@@ -1,6 +1,8 @@
 from collections import deque
 from typing import List, Set, Tuple
 
+import numpy as np
+
 def read_input(input_file_dir):
     """
     Reads the topographic map from the input file and converts it into a grid of integers.
@@ -95,11 +97,137 @@ def calculate_total_score(grid, mode="score") -> int:
     return sum(evaluate_trailhead_potential(grid, r, c, mode) for r, c in trailheads)
 
 
+def flatten_padded_grid(grid):
+    """
+    Flatten the grid into a single list with a one-cell border of height -2 around it, so that the four
+    neighbours of a cell are always at index +-1 and +-width and no bounds checks are needed
+    (the border is never exactly one higher than a real cell).
+
+    Returns a tuple (heights, width).
+    """
+    width = len(grid[0]) + 2
+    border = [-2] * width
+    heights = list(border)
+    for row in grid:
+        heights += [-2] + list(row) + [-2]
+    heights += border
+    return heights, width
+
+
+# summits within reach of one cell are numbered by their position modulo SUMMIT_PERIOD (see calculate_total_score_dp)
+SUMMIT_PERIOD = 19
+SUMMIT_BITS = SUMMIT_PERIOD * SUMMIT_PERIOD
+
+
+def summit_bit(i, width):
+    """ Returns the bit of the summit at flat index i of a grid `width` cells wide (see calculate_total_score_dp). """
+    row, col = divmod(i, width)
+    return (row % SUMMIT_PERIOD) * SUMMIT_PERIOD + col % SUMMIT_PERIOD
+
+
+def calculate_total_score_dp(grid, mode="score"):
+    """
+    Calculate the same total as calculate_total_score for the whole grid at once, processing cells in layers
+    from height 9 down to 0 on a flat array instead of running a search from every trailhead.
+
+    Type of evaluation - 'score' or 'rating'.
+        - 'rating': every cell gets the number of hiking trails from it to any height 9, which is the sum over
+          its neighbours one higher (height 9 cells count 1).
+        - 'score': every height 9 cell gets a bit, and every other cell gets the union (bitwise OR) of the
+          bitsets of its neighbours one higher; a trailhead's score is the popcount of its bitset.
+          A cell only reaches summits within 9 steps, so two summits it reaches are less than 19 rows and 19
+          columns apart: numbering summits by (row % 19, column % 19) keeps them distinct within every bitset,
+          which therefore never grows past SUMMIT_BITS bits whatever the number of summits.
+
+    Each layer's values are dropped once the layer below is done, so only two layers are held at a time.
+
+    Returns the total metric for all trailheads in the grid.
+    """
+    if mode not in ("score", "rating"):
+        raise ValueError("invalid mode")
+
+    heights, width = flatten_padded_grid(grid)
+    layers = [[] for _ in range(10)]
+    for i, height in enumerate(heights):
+        if 0 <= height <= 9:
+            layers[height].append(i)
+
+    values = [0] * len(heights)
+    for i in layers[9]:
+        values[i] = 1 if mode == "rating" else 1 << summit_bit(i, width)
+
+    for height in range(8, -1, -1):
+        for i in layers[height]:
+            value = 0
+            for neighbour in (i - width, i + 1, i + width, i - 1):
+                if heights[neighbour] == height + 1:
+                    if mode == "rating":
+                        value += values[neighbour]
+                    else:
+                        value |= values[neighbour]
+            values[i] = value
+        for i in layers[height + 1]:
+            values[i] = 0
+
+    if mode == "rating":
+        return sum(values[i] for i in layers[0])
+    return sum(values[i].bit_count() for i in layers[0])
+
+
+def popcount(words):
+    """ Total number of set bits in an array of uint64 words. """
+    if hasattr(np, "bitwise_count"): # numpy >= 2.0
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+def calculate_total_score_bitsets(grid, chunk_words=None):
+    """
+    Calculate the same total score as calculate_total_score(grid, 'score') with numpy: every height 9 cell gets
+    a bit numbered by its position modulo SUMMIT_PERIOD (see calculate_total_score_dp), so each cell's set of
+    reachable summits fits in a row of SUMMIT_BITS / 64 packed uint64 words (6) however many summits there are.
+    Rows are OR-ed into their lower neighbours layer by layer from height 9 down to 0 with one gathered operation
+    per height and direction, and a trailhead's score is the popcount of its row.
+
+    `chunk_words` trades time for memory: the words are processed that many at a time, each in its own pass
+    over the grid, so memory is cells * chunk_words * 8 bytes (default: all words in a single pass).
+
+    Returns the total score of all trailheads in the grid.
+    """
+    heights, width = flatten_padded_grid(grid)
+    heights = np.array(heights, dtype=np.int8)
+    summits = np.flatnonzero(heights == 9)
+    trailheads = np.flatnonzero(heights == 0)
+    rows, cols = np.divmod(summits, width)
+    bits = (rows % SUMMIT_PERIOD) * SUMMIT_PERIOD + cols % SUMMIT_PERIOD
+    words = (SUMMIT_BITS + 63) // 64
+    chunk_words = chunk_words or words
+
+    # for every height and direction: the cells one lower than their neighbour in that direction
+    steps = []
+    for height in range(8, -1, -1):
+        cells = np.flatnonzero(heights == height)
+        for offset in (-width, 1, width, -1):
+            uphill = cells[heights[cells + offset] == height + 1]
+            steps.append((uphill, uphill + offset))
+
+    total = 0
+    for first in range(0, words, chunk_words):
+        count = min(chunk_words, words - first)
+        in_chunk = (bits // 64 >= first) & (bits // 64 < first + count)
+        reachable = np.zeros((len(heights), count), dtype=np.uint64)
+        reachable[summits[in_chunk], bits[in_chunk] // 64 - first] = np.left_shift(np.uint64(1), (bits[in_chunk] % 64).astype(np.uint64))
+        for cells, neighbours in steps:
+            reachable[cells] |= reachable[neighbours]
+        total += popcount(reachable[trailheads])
+    return total
+
+
 if __name__ == "__main__":
     grid = read_input("input.txt")
 
     # part 1
-    print(calculate_total_score(grid, "score"))
+    print(calculate_total_score_dp(grid, "score"))
 
     # part 2
-    print(calculate_total_score(grid, "rating"))
+    print(calculate_total_score_dp(grid, "rating"))
@@ -0,0 +1,39 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 41  # side length of the square map
+DIMENSIONS = 2
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, noise=0.1):
+    """
+    Generate a `size` x `size` topographic map. Heights follow a diagonal 0-9-0 ramp so that plenty of
+    hiking trails exist, and a fraction `noise` of the cells are replaced by random heights.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    offset = rng.randrange(18)
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            if rng.random() < noise:
+                row.append(str(rng.randrange(10)))
+            else:
+                x = (r + c + offset) % 18
+                row.append(str(x if x <= 9 else 18 - x))
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day10 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="side length of the map")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--noise", type=float, default=0.1, help="fraction of cells with a random height")
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.noise))
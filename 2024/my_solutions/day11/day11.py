@@ -1,4 +1,6 @@
-from functools import cache 
+from functools import cache, lru_cache
+
+import numpy as np
 
 def read_input(input_file_dir):
     """
@@ -27,14 +29,12 @@ def simulate_blinks(stones, blinks=25):
                 output.append(1)
                 continue
             
-            # Convert stone to string for digit manipulation
-            string = str(stone)
-            length = len(string)
+            # Count digits arithmetically (see count_digits)
+            length = count_digits(stone)
             
             # Rule 2: If even number of digits, split into two stones
             if length % 2 == 0:
-                output.append(int(string[:length // 2]))
-                output.append(int(string[length // 2:]))
+                output.extend(divmod(stone, POWERS_OF_TEN[length // 2]))
             else:
                 # Rule 3: If no other rules apply, multiply by 2024
                 output.append(stone * 2024)
@@ -60,26 +60,299 @@ def calc_stones_after_blinks(stone, blinks):
     if stone == 0:
         return calc_stones_after_blinks(1, blinks - 1)
     
-    # Convert stone to string for digit manipulation
-    string = str(stone)
-    length = len(string)
+    # Count digits arithmetically (see count_digits)
+    length = count_digits(stone)
     
     # Rule 2: If even number of digits, split into two stones
     if length % 2 == 0:
+        left, right = divmod(stone, POWERS_OF_TEN[length // 2])
         return (
-            calc_stones_after_blinks(int(string[:length // 2]), blinks - 1) + 
-            calc_stones_after_blinks(int(string[length // 2:]), blinks - 1)
+            calc_stones_after_blinks(left, blinks - 1) + 
+            calc_stones_after_blinks(right, blinks - 1)
         )
     
     # Rule 3: If no other rules apply, multiply by 2024
     return calc_stones_after_blinks(stone * 2024, blinks - 1)
 
 
+# powers of ten for arithmetic digit counting and splitting, extended on demand for larger stones
+POWERS_OF_TEN = [10 ** k for k in range(20)]
+
+
+def count_digits(stone):
+    """
+    Count the decimal digits of a positive number without converting it to a string: a number of b bits has
+    floor(b * log10(2)) or one more digits (1233 / 4096 approximates log10(2)), and one comparison with the
+    powers-of-ten table decides which.
+
+    Returns the number of digits.
+    """
+    estimate = (stone.bit_length() * 1233) >> 12
+    while estimate >= len(POWERS_OF_TEN):
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return estimate + (stone >= POWERS_OF_TEN[estimate])
+
+
+def blink_stone(stone):
+    """
+    Apply the blink rules to a single stone.
+
+    Returns a tuple of the stones it turns into (one or two).
+    """
+    # Rule 1: If stone is 0, replace with 1
+    if stone == 0:
+        return (1,)
+
+    # Rule 2: If even number of digits, split into two stones (the left and right halves of the digits)
+    digits = count_digits(stone)
+    if digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[digits // 2])
+
+    # Rule 3: If no other rules apply, multiply by 2024
+    return (stone * 2024,)
+
+
+def memoized_blink(maxsize=4096):
+    """
+    Wrap blink_stone in a bounded LRU cache of its own, so memory stays predictable when many stone sets are
+    simulated in one process. The wrapper's cache_info() reports hits, misses and the current size, and
+    cache_clear() empties it.
+
+    Returns the memoized blink function.
+    """
+    return lru_cache(maxsize=maxsize)(blink_stone)
+
+
+def count_stones_after_blinks(stones, blinks, transition=blink_stone):
+    """
+    Count stones after the specified blinks by keeping a map from each distinct value to the number of stones
+    carrying it, so the work per blink is proportional to the number of distinct values rather than stones.
+    `transition` maps one stone to the stones it turns into (blink_stone, or a memoized_blink wrapper).
+
+    Returns the number of stones after specified blinks.
+    """
+    counts = {}
+    for stone in stones:
+        counts[stone] = counts.get(stone, 0) + 1
+
+    for _ in range(blinks):
+        counts = blink_counts(counts, transition)
+
+    return sum(counts.values())
+
+
+def blink_counts(counts, transition=blink_stone, modulus=None):
+    """
+    Apply one blink to a map from stone values to stone counts, optionally reducing the counts modulo `modulus`.
+
+    Returns the new map.
+    """
+    next_counts = {}
+    for stone, count in counts.items():
+        for new_stone in transition(stone):
+            next_counts[new_stone] = next_counts.get(new_stone, 0) + count
+    if modulus is not None:
+        next_counts = {stone: count % modulus for stone, count in next_counts.items()}
+    return next_counts
+
+
+def find_transition_graph(stones, transition=blink_stone):
+    """
+    Discover every stone value reachable from the given stones (a finite set under the blink rules) and split it
+    into transient and recurrent values by repeatedly removing values that no remaining value turns into. What is
+    left are the values on cycles and everything they lead to: it is closed under blinking, and stones on a
+    transient value always reach it within a bounded number of blinks.
+
+    Returns a tuple (successors, recurrent): a dict from each value to the stones it turns into, and the list of
+    recurrent values.
+    """
+    successors = {}
+    pending = list(dict.fromkeys(stones))
+    while pending:
+        stone = pending.pop()
+        if stone in successors:
+            continue
+        successors[stone] = transition(stone)
+        pending.extend(new_stone for new_stone in successors[stone] if new_stone not in successors)
+
+    in_degree = dict.fromkeys(successors, 0)
+    for new_stones in successors.values():
+        for new_stone in new_stones:
+            in_degree[new_stone] += 1
+    removed = set()
+    sources = [stone for stone, degree in in_degree.items() if degree == 0]
+    while sources:
+        stone = sources.pop()
+        removed.add(stone)
+        for new_stone in successors[stone]:
+            in_degree[new_stone] -= 1
+            if in_degree[new_stone] == 0:
+                sources.append(new_stone)
+
+    return successors, [stone for stone in successors if stone not in removed]
+
+
+def multiply_mod(a, b, modulus):
+    """
+    Multiply two int64 matrices of residues modulo `modulus` (below 2**32) exactly with float64 BLAS products:
+    each factor is split into 16-bit halves and combined Karatsuba-style (three products), which keeps every
+    partial sum below 2**53 for matrices of up to 2**18 rows.
+
+    Returns the product modulo `modulus` as an int64 matrix.
+    """
+    a_high, a_low = (a >> 16).astype(np.float64), (a & 0xFFFF).astype(np.float64)
+    b_high, b_low = (b >> 16).astype(np.float64), (b & 0xFFFF).astype(np.float64)
+    high = a_high @ b_high
+    low = a_low @ b_low
+    middle = (a_high + a_low) @ (b_high + b_low) - high - low
+    high, middle, low = (part.astype(np.int64) % modulus for part in (high, middle, low))
+    return ((((high << 16) % modulus + middle) % modulus << 16) % modulus + low) % modulus
+
+
+# rough cost of one stone-count update in blink_counts, in multiply-adds of a matrix product: float64 BLAS
+# products are about 10**4 times cheaper, Python ints in object arrays about as expensive
+STEP_COST = {"float": 10_000, "object": 1}
+
+
+def count_stones_matrix_power(stones, blinks, modulus=None, transition=blink_stone, method="auto"):
+    """
+    Count stones after a very large number of blinks (e.g. 10**9) without stepping through them: the stones are
+    blinked one step at a time only until all of them sit on recurrent values (see find_transition_graph), and the
+    remaining blinks are applied at once as a power of the transition matrix over the recurrent values (entry
+    [i, j] is the number of stones of value j one stone of value i turns into), computed by repeated squaring.
+
+    The transitions themselves are sparse (one or two per value), but powers of the matrix fill in, so squaring
+    is done on dense matrices:
+    - modulus below 2**32: numpy float64 matrix products (see multiply_mod), fast even for thousands of values
+    - modulus=None (exact counts) or larger moduli: Python ints in numpy object arrays, which is only practical
+      for small graphs such as the values reachable from single-digit stones
+
+    method: 'matrix' always takes the matrix power and 'step' always blinks one step at a time (blink_counts,
+    reducing counts modulo `modulus`). 'auto' (default) falls back to stepping when it is estimated to be cheaper:
+    blinks * values * STEP_COST against values**3 * log2(blinks) for the squarings. On the puzzle input (3811
+    recurrent values, float products) stepping wins up to a few times 10**4 blinks.
+
+    Returns the number of stones after specified blinks (modulo `modulus` if given).
+    """
+    successors, recurrent = find_transition_graph(stones, transition)
+    recurrent_set = set(recurrent)
+
+    counts = {}
+    for stone in stones:
+        counts[stone] = counts.get(stone, 0) + 1
+    while blinks and not recurrent_set.issuperset(counts):
+        counts = blink_counts(counts, successors.__getitem__, modulus)
+        blinks -= 1
+    fast = modulus is not None and modulus < 2 ** 32
+    size = len(recurrent)
+    if method not in ("auto", "matrix", "step"):
+        raise ValueError(f"invalid method: {method}")
+    if method == "step" or (method == "auto" and blinks * size * STEP_COST["float" if fast else "object"] <= size ** 3 * blinks.bit_length()):
+        for _ in range(blinks):
+            counts = blink_counts(counts, successors.__getitem__, modulus)
+        blinks = 0
+    if not blinks:
+        total = sum(counts.values())
+        return total % modulus if modulus is not None else total
+
+    dtype = np.int64 if fast else object
+    index = {stone: i for i, stone in enumerate(recurrent)}
+    matrix = np.zeros((size, size), dtype=np.int64)
+    for stone in recurrent:
+        for new_stone in successors[stone]:
+            matrix[index[stone], index[new_stone]] += 1
+    matrix = matrix.astype(dtype)
+    vector = np.zeros((1, size), dtype=dtype)
+    for stone, count in counts.items():
+        vector[0, index[stone]] = count
+
+    def multiply(a, b):
+        if fast:
+            return multiply_mod(a, b, modulus)
+        product = a.dot(b)
+        return product % modulus if modulus is not None else product
+
+    if fast:
+        matrix %= modulus
+    while blinks:
+        if blinks & 1:
+            vector = multiply(vector, matrix)
+        blinks >>= 1
+        if blinks:
+            matrix = multiply(matrix, matrix)
+
+    total = int(vector.sum())
+    return total % modulus if modulus is not None else total
+
+
+INT64_POWERS_OF_TEN = np.array(POWERS_OF_TEN[:19], dtype=np.int64) # every power of ten below 2**63
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def blink_arrays(values, counts):
+    """
+    Apply one blink to an array of distinct stone values and an array of their counts (both int64) at once:
+    digits are counted with a search in the powers-of-ten table, each rule is applied to its whole group of
+    values, and counts of values that come out equal are merged.
+
+    Returns a tuple of the new (values, counts) arrays.
+    """
+    digits = np.searchsorted(INT64_POWERS_OF_TEN, values, side="right") # 0 for the value 0
+    zero = values == 0
+    split = (digits % 2 == 0) & ~zero
+    multiply = ~zero & ~split
+
+    divisor = INT64_POWERS_OF_TEN[digits[split] // 2]
+    new_values = np.concatenate([np.ones(np.count_nonzero(zero), dtype=np.int64),
+                                 values[split] // divisor, values[split] % divisor,
+                                 values[multiply] * 2024])
+    new_counts = np.concatenate([counts[zero], counts[split], counts[split], counts[multiply]])
+
+    order = np.argsort(new_values, kind="stable")
+    new_values, new_counts = new_values[order], new_counts[order]
+    starts = np.flatnonzero(np.concatenate([[True], new_values[1:] != new_values[:-1]]))
+    return new_values[starts], np.add.reduceat(new_counts, starts)
+
+
+def count_stones_vectorized(stones, blinks):
+    """
+    Count stones after the specified blinks like count_stones_after_blinks, with every blink applied to numpy
+    arrays of distinct values and their counts (see blink_arrays). Once a value about to be multiplied or the
+    total count could exceed int64, the remaining blinks continue with Python ints (see blink_counts). Stones
+    that do not fit in int64 to begin with are counted with Python ints throughout (count_stones_after_blinks).
+
+    Returns the number of stones after specified blinks.
+    """
+    if not stones:
+        return 0
+    if max(stones) > INT64_MAX:
+        return count_stones_after_blinks(stones, blinks)
+
+    values, counts = np.unique(np.array(stones, dtype=np.int64), return_counts=True)
+    counts = counts.astype(np.int64)
+
+    while blinks:
+        odd_digits = (np.searchsorted(INT64_POWERS_OF_TEN, values, side="right") % 2 == 1)
+        # a blink at most doubles the total, which is at most (number of values) * (largest count)
+        if np.any(values[odd_digits] > INT64_MAX // 2024) or int(counts.max()) * len(counts) > INT64_MAX // 2:
+            break
+        values, counts = blink_arrays(values, counts)
+        blinks -= 1
+
+    if not blinks:
+        return int(counts.sum())
+
+    stone_counts = dict(zip(values.tolist(), counts.tolist()))
+    for _ in range(blinks):
+        stone_counts = blink_counts(stone_counts)
+    return sum(stone_counts.values())
+
+
 if __name__ == "__main__":
     stones = read_input("input.txt")
 
     # part 1
-    print(simulate_blinks(stones)) # after 25 blinks
+    print(count_stones_after_blinks(stones, 25))
 
     # part 2
-    print(sum(calc_stones_after_blinks(stone, 75) for stone in stones)) # after 75 blinks
+    print(count_stones_vectorized(stones, 75))
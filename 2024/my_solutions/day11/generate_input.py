@@ -0,0 +1,27 @@
+import argparse
+import random
+
+DEFAULT_SIZE = 8  # number of stones
+DIMENSIONS = 1
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, max_value=10 ** 6):
+    """
+    Generate a single line of `size` stone engravings below `max_value`.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    return " ".join(str(rng.randrange(max_value)) for _ in range(size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day11 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="number of stones")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--max-value", type=int, default=10 ** 6)
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.max_value))
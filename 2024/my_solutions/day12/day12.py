@@ -1,3 +1,5 @@
+import numpy as np
+
 def read_input(input_file_dir):
     """
     Reads the map of garden plots from the input file and converts it into a grid of characters.
@@ -113,14 +115,157 @@ def count_sides(region):
     return sides
 
 
+def find_root(parent, label):
+    """
+    Find the representative label of a union-find set, compressing the path on the way (path halving).
+
+    Returns the root label.
+    """
+    while parent[label] != label:
+        parent[label] = parent[parent[label]]
+        label = parent[label]
+    return label
+
+
+def label_regions(grid):
+    """
+    Label the regions of the grid with a two-pass scanline (connected-component labeling with union-find)
+    instead of a search per region, measuring every region in the same sweep:
+    - area: number of cells
+    - perimeter: cell sides that do not touch the same crop
+    - sides: number of corners, which equals the number of straight sides. A cell has a convex corner towards
+      a diagonal where both orthogonal neighbours differ, and a concave corner where both match but the
+      diagonal cell differs (a matching neighbour is always in the same region, so crops can be compared).
+
+    Returns a tuple (labels, areas, perimeters, sides): a 2D list with the region index of each cell, numbered
+    in the order find_regions finds the regions, and one list entry per region for each measure.
+    """
+    rows, cols = len(grid), len(grid[0])
+    # flat grid with a border of None around it, so neighbours never go out of bounds
+    width = cols + 2
+    cells = [None] * width
+    for row in grid:
+        cells += [None] + list(row) + [None]
+    cells += [None] * width
+
+    # first pass: provisional labels from the cells above and to the left, merging labels that meet
+    provisional = [0] * len(cells)
+    parent, areas, perimeters, corners = [], [], [], []
+    for i in range(width + 1, len(cells) - width - 1):
+        crop = cells[i]
+        if crop is None:
+            continue
+        up, left = cells[i - width] == crop, cells[i - 1] == crop
+        if up and left:
+            label = find_root(parent, provisional[i - 1])
+            other = find_root(parent, provisional[i - width])
+            if other != label:
+                parent[other] = label
+        elif up:
+            label = provisional[i - width]
+        elif left:
+            label = provisional[i - 1]
+        else:
+            label = len(parent)
+            parent.append(label)
+            areas.append(0)
+            perimeters.append(0)
+            corners.append(0)
+        provisional[i] = label
+
+        same = [cells[i + offset] == crop for offset in (-width, 1, width, -1)] # up, right, down, left
+        areas[label] += 1
+        perimeters[label] += 4 - sum(same)
+        for k, diagonal in enumerate((-width + 1, width + 1, width - 1, -width - 1)): # up-right, down-right, ...
+            first, second = same[k], same[(k + 1) % 4]
+            if (not first and not second) or (first and second and cells[i + diagonal] != crop):
+                corners[label] += 1
+
+    # second pass: resolve every provisional label to its root, numbering the regions in scan order
+    index_of_root = {}
+    region_areas, region_perimeters, region_sides = [], [], []
+    labels = []
+    for r in range(rows):
+        row = []
+        for c in range(cols):
+            root = find_root(parent, provisional[(r + 1) * width + c + 1])
+            if root not in index_of_root:
+                index_of_root[root] = len(index_of_root)
+                region_areas.append(0)
+                region_perimeters.append(0)
+                region_sides.append(0)
+            row.append(index_of_root[root])
+        labels.append(row)
+
+    for label in range(len(parent)):
+        index = index_of_root[find_root(parent, label)]
+        region_areas[index] += areas[label]
+        region_perimeters[index] += perimeters[label]
+        region_sides[index] += corners[label]
+
+    return labels, region_areas, region_perimeters, region_sides
+
+
+def measure_regions_vectorized(labels):
+    """
+    Measure all regions of a label array (e.g. from label_regions, region indices 0..n-1) at once with numpy
+    instead of per cell, using a border of -1 around the labels:
+    - perimeter: every horizontal and vertical boundary between two different labels adds one to each side of it
+    - sides: every 2x2 window is classified for each of its four cells: the cell has a corner at the window's
+      centre if both its neighbours in the window have other labels (convex), or both share its label but the
+      diagonal cell does not (concave)
+    Per-label totals are collected with np.bincount.
+
+    Returns a tuple of three numpy arrays (areas, perimeters, sides), indexed by label.
+    """
+    labels = np.asarray(labels)
+    count = int(labels.max()) + 1 if labels.size else 0
+    padded = np.pad(labels, 1, constant_values=-1)
+
+    def totals(owners, mask):
+        """ Number of True entries in mask per owner label, border cells excluded. """
+        selected = owners[mask & (owners >= 0)]
+        return np.bincount(selected, minlength=count)
+
+    areas = np.bincount(labels.ravel(), minlength=count)
+
+    perimeters = np.zeros(count, dtype=np.int64)
+    for first, second in ((padded[:-1, :], padded[1:, :]), (padded[:, :-1], padded[:, 1:])):
+        boundary = first != second
+        perimeters += totals(first, boundary) + totals(second, boundary)
+
+    # the four cells of every 2x2 window, each listed with its horizontal, vertical and diagonal neighbour
+    top_left, top_right = padded[:-1, :-1], padded[:-1, 1:]
+    bottom_left, bottom_right = padded[1:, :-1], padded[1:, 1:]
+    sides = np.zeros(count, dtype=np.int64)
+    for cell, horizontal, vertical, diagonal in ((top_left, top_right, bottom_left, bottom_right),
+                                                 (top_right, top_left, bottom_right, bottom_left),
+                                                 (bottom_left, bottom_right, top_left, top_right),
+                                                 (bottom_right, bottom_left, top_right, top_left)):
+        same_horizontal, same_vertical = horizontal == cell, vertical == cell
+        corner = (~same_horizontal & ~same_vertical) | (same_horizontal & same_vertical & (diagonal != cell))
+        sides += totals(cell, corner)
+
+    return areas, perimeters, sides
+
+
+def fencing_price(areas, measures):
+    """
+    Calculate the total fencing price from per-region areas and a per-region measure (perimeter or sides).
+
+    Returns the sum of area × measure over all regions.
+    """
+    return sum(area * measure for area, measure in zip(areas, measures))
+
+
 if __name__ == "__main__":
     grid_garden_plots = read_input("input.txt")
-    regions = find_regions(grid_garden_plots)
+    labels, areas, perimeters, sides = label_regions(grid_garden_plots)
 
     # part 1
     # The total price of fencing regions using area × perimeter
-    print(sum(len(region) * calculate_region_perimeter(region) for region in regions))
+    print(fencing_price(areas, perimeters))
 
     # part 2
     # The total price using area × sides (multiplies region area by number of sides instead of perimeter)
-    print(sum(len(region) * count_sides(region) for region in regions))
+    print(fencing_price(areas, sides))
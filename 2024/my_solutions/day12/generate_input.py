@@ -0,0 +1,43 @@
+import argparse
+import random
+import string
+
+DEFAULT_SIZE = 140  # side length of the square garden
+DIMENSIONS = 2
+
+
+def generate_input(size=DEFAULT_SIZE, seed=None, block=6, noise=0.15):
+    """
+    Generate a `size` x `size` garden map. Plants are laid out in `block` x `block` patches of a random
+    letter, and a fraction `noise` of the cells copy a random neighbouring patch to give ragged regions.
+
+    Returns the input file contents as a string.
+    """
+    rng = random.Random(seed)
+    patches = -(-size // block) + 1
+    coarse = [[rng.choice(string.ascii_uppercase) for _ in range(patches)] for _ in range(patches)]
+
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            pr, pc = r // block, c // block
+            if rng.random() < noise:
+                pr = min(patches - 1, max(0, pr + rng.choice((-1, 0, 1))))
+                pc = min(patches - 1, max(0, pc + rng.choice((-1, 0, 1))))
+            row.append(coarse[pr][pc])
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a day12 input.")
+    parser.add_argument("size", type=int, nargs="?", default=DEFAULT_SIZE, help="side length of the garden")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--block", type=int, default=6, help="side length of the plant patches")
+    parser.add_argument("--noise", type=float, default=0.15, help="fraction of cells taken from a neighbouring patch")
+    parser.add_argument("-o", "--output", default="input_generated.txt")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(generate_input(args.size, args.seed, args.block, args.noise))
@@ -0,0 +1,84 @@
+import argparse
+import os
+
+from benchmark import DAYS, discover_days, load_day_module
+
+
+def scaled_size(generator, scale):
+    """
+    Scale a generator's default size so that the amount of input grows by `scale`
+    (grids grow their side length by sqrt(scale)).
+
+    Returns the size to pass to the generator.
+    """
+    return max(1, round(generator.DEFAULT_SIZE * scale ** (1 / generator.DIMENSIONS)))
+
+
+def parse_param(text):
+    """
+    Parse a generator option of the form DAY:NAME=VALUE, e.g. 'day05:pages=2000'. Numeric values
+    are converted to int or float.
+
+    Returns a tuple (day, name, value).
+    """
+    day, _, assignment = text.partition(":")
+    name, _, value = assignment.partition("=")
+    if not (day and name and value):
+        raise ValueError(f"expected DAY:NAME=VALUE, got {text!r}")
+    for convert in (int, float):
+        try:
+            return day, name, convert(value)
+        except ValueError:
+            pass
+    return day, name, value
+
+
+def generate_inputs(output_dir, scale=1.0, seed=None, days=None, sizes=None, params=None):
+    """
+    Write a generated <day>.txt input for each selected day into `output_dir`, ready for
+    `benchmark.py --input-dir`. Explicit `sizes` ({day: size}) take precedence over `scale`, and
+    `params` ({day: {name: value}}) are passed to the day's generator as keyword arguments
+    (e.g. {'day05': {'pages': 2000}} to scale the rule set).
+
+    Returns a dict mapping each day to the path of its generated input.
+    """
+    sizes = sizes or {}
+    params = params or {}
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = {}
+    for day in discover_days(days):
+        generator = load_day_module(day, "generate_input")
+        size = sizes.get(day, scaled_size(generator, scale))
+        path = os.path.join(output_dir, f"{day}.txt")
+        with open(path, "w") as f:
+            f.write(generator.generate_input(size, seed, **params.get(day, {})))
+        paths[day] = path
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate scaled puzzle inputs for the benchmark runner.")
+    parser.add_argument("output_dir")
+    parser.add_argument("days", nargs="*", help="days to generate, e.g. day06 day09 (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="input size relative to the puzzle input, e.g. 10 or 1000")
+    parser.add_argument("--size", action="append", default=[], metavar="DAY=SIZE", help="explicit size for one day, e.g. day09=1000000")
+    parser.add_argument("--param", action="append", default=[], metavar="DAY:NAME=VALUE", help="extra generator option, e.g. day05:pages=2000")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.days) - set(DAYS))
+    if unknown:
+        parser.error(f"unknown day(s): {', '.join(unknown)} (expected names like day01)")
+
+    sizes = {day: int(size) for day, size in (item.split("=") for item in args.size)}
+    params = {}
+    for item in args.param:
+        try:
+            day, name, value = parse_param(item)
+        except ValueError as error:
+            parser.error(str(error))
+        params.setdefault(day, {})[name] = value
+
+    for day, path in generate_inputs(args.output_dir, args.scale, args.seed, args.days, sizes, params).items():
+        print(f"{day}: {path} ({os.path.getsize(path)} bytes)")
@@ -0,0 +1,57 @@
+import functools
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+SOLUTIONS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SOLUTIONS_DIR)
+
+from benchmark import load_day_module
+
+
+@functools.cache
+def day_module(day, module_name=None):
+    """
+    Import a day's solution module (or another module from its directory, e.g. 'generate_input') once per test run.
+
+    Returns the imported module.
+    """
+    return load_day_module(day, module_name)
+
+
+def puzzle_input(day):
+    """ Returns the path of a day's puzzle input. """
+    return os.path.join(SOLUTIONS_DIR, day, "input.txt")
+
+
+def generate(day, size, seed, **kwargs):
+    """
+    Generate a random input with a day's generate_input module.
+
+    Returns the input file contents as a string.
+    """
+    return day_module(day, "generate_input").generate_input(size, seed, **kwargs)
+
+
+@contextmanager
+def temporary_input(contents):
+    """ Write input file contents to a temporary file that is removed afterwards, yielding its path. """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        with open(path, "w") as f:
+            f.write(contents)
+        yield path
+
+
+def input_paths(day, size, seeds, **kwargs):
+    """
+    Iterate over input files for a day: the puzzle input first, then one generated input of `size` per seed
+    (extra keyword arguments go to generate_input). Each generated file exists until the next one is requested.
+
+    Yields input file paths.
+    """
+    yield puzzle_input(day)
+    for seed in seeds:
+        with temporary_input(generate(day, size, seed, **kwargs)) as path:
+            yield path
@@ -0,0 +1,19 @@
+from helpers import day_module, input_paths
+
+day02 = day_module("day02")
+
+
+def test_fast_paths_match_per_report_checks():
+    for path in input_paths("day02", 300, range(50), min_levels=1, max_levels=9):
+        reports = day02.read_input(path)
+        levels, lengths = day02.read_input_padded(path)
+        reports_by_length = day02.read_input_by_length(path)
+        for use_dampener in (False, True):
+            expected = day02.count_safe_reports(reports, use_dampener)
+            assert day02.count_safe_reports_vectorized(levels, lengths, use_dampener, batch_size=64) == expected, path
+            assert day02.count_safe_reports_by_length(reports_by_length, use_dampener) == expected, path
+            # long reports through the linear check
+            assert day02.count_safe_reports_by_length(reports_by_length, use_dampener, long_report_length=4) == expected, path
+        expected = day02.count_safe_reports(reports, use_dampener=True)
+        assert day02.count_safe_reports(reports, safety_check=day02.is_report_safe_with_dampener_linear) == expected, path
+        assert day02.count_safe_reports(day02.iter_reports(path), use_dampener=True) == expected, path
@@ -0,0 +1,34 @@
+import random
+
+from helpers import day_module, input_paths
+
+day03 = day_module("day03")
+
+
+def test_backends_and_scanners_match_string_functions():
+    for path in input_paths("day03", 3000, range(30)):
+        memory = day03.read_input(path)
+        expected = day03.sum_multiplications(memory)
+        expected_active = day03.sum_active_multiplications(memory)
+        for backend in day03.BACKENDS:
+            assert day03.sum_multiplications(memory, backend) == expected, (path, backend)
+        for chunk_size in (1, 2, 3, 7, 64, 1 << 20):
+            assert day03.sum_multiplications_streaming(path, chunk_size) == expected, (path, chunk_size)
+            assert day03.scan_memory_file(path, chunk_size) == (expected, expected_active), (path, chunk_size)
+
+
+def test_streaming_carry_across_chunk_boundaries():
+    rng = random.Random(0)
+    fragments = ["mul", "(", ")", ",", "1", "23", "4567", " ", "m", "u", "x", "mul(1,2)"]
+    for _ in range(2000):
+        memory = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 20)))
+        for chunk_size in range(1, 6):
+            chunks = (memory[i:i + chunk_size] for i in range(0, len(memory), chunk_size))
+            assert sum(x * y for x, y in day03.iter_multiplication_operands(chunks)) == day03.sum_multiplications(memory), (memory, chunk_size)
+
+
+def test_streaming_long_stretch_after_mul():
+    # the carry must not grow with the stretch (it would rescan it for every chunk)
+    memory = "mul(" + "x" * 2_000_000 + "mul(3,4)"
+    chunks = (memory[i:i + 1000] for i in range(0, len(memory), 1000))
+    assert list(day03.iter_multiplication_operands(chunks)) == [(3, 4)]
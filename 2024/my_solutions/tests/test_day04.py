@@ -0,0 +1,20 @@
+from helpers import day_module, generate, puzzle_input
+
+day04 = day_module("day04")
+
+
+def test_vectorized_search_matches_presets():
+    grids = [day04.read_input(puzzle_input("day04"))]
+    grids += [generate("day04", size, seed).splitlines() for seed, size in enumerate([1, 2, 3, 4, 5, 17, 60] * 3)]
+    grids.append(["XMASAMX"]) # single row
+    grids.append(list("XMASAMX")) # single column
+    for grid in grids:
+        for mode in ("XMAS", "X-MAS"):
+            assert day04.find_occurrences_vectorized(grid, mode) == day04.find_occurrences(grid, mode), (grid, mode)
+
+
+def test_word_engines_agree():
+    words = ["XMAS", "SAM", "MM", "X", "AXA"]
+    for seed, size in enumerate([1, 2, 5, 17, 40]):
+        grid = generate("day04", size, seed).splitlines()
+        assert day04.search_grid(grid, words) == day04.search_grid(grid, words, engine="automaton"), size
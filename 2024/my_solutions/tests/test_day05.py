@@ -0,0 +1,24 @@
+from helpers import day_module, input_paths
+
+day05 = day_module("day05")
+
+
+def test_rule_set_matches_per_update_lookups():
+    for path in input_paths("day05", 100, range(20), pages=30):
+        rules, updates = day05.read_input(path)
+        # drop some rules so that updates are no longer totally ordered for the exact check
+        partial_rules = rules[::2]
+        for rule_list, adjacent_only in ((rules, False), (rules, True), (partial_rules, False)):
+            valid = [day05.is_valid_order(update, rule_list) for update in updates]
+            expected_valid = sum(update[len(update) // 2] for update, ok in zip(updates, valid) if ok)
+            expected_reordered = sum(day05.reorder_update(update, rule_list)[len(update) // 2] for update, ok in zip(updates, valid) if not ok)
+            assert day05.calc_middle_pages(rule_list, updates, True, adjacent_only) == expected_valid, path
+            assert day05.calc_middle_pages(rule_list, updates, False, adjacent_only) == expected_reordered, path
+        for process_valid_updates in (True, False):
+            expected = day05.calc_middle_pages(rules, updates, process_valid_updates)
+            assert day05.calc_middle_pages(day05.read_rules(path), day05.iter_updates(path), process_valid_updates) == expected, path
+        # counting predecessors is exact when the rules totally order each update
+        assert day05.calc_middle_pages(rules, updates, False, count_middle=True) == day05.calc_middle_pages(rules, updates, False), path
+        for rule_list, process_valid_updates in ((rules, True), (rules, False), (partial_rules, True)):
+            expected = day05.calc_middle_pages(rule_list, updates, process_valid_updates)
+            assert day05.calc_middle_pages_vectorized(rule_list, updates, process_valid_updates) == expected, path
@@ -0,0 +1,20 @@
+from helpers import day_module, generate, puzzle_input
+
+day06 = day_module("day06")
+
+
+def check_obstruction_positions(grid, workers, chunk_size):
+    """ Compare the route-pruned search (serial and in a process pool) and the flat-buffer search with the brute force search. """
+    expected = day06.find_obstruction_positions(grid)
+    assert day06.find_obstruction_positions_on_route(grid) == expected
+    assert day06.find_obstruction_positions_on_route(grid, workers, chunk_size) == expected
+    assert day06.find_obstruction_positions_flat(grid) == expected
+
+
+def test_searches_match_brute_force_on_input():
+    check_obstruction_positions(day06.read_input(puzzle_input("day06")), workers=4, chunk_size=100)
+
+
+def test_searches_match_brute_force_on_small_maps():
+    for seed in range(400):
+        check_obstruction_positions([list(line) for line in generate("day06", 12, seed, obstacle_density=0.15).splitlines()], workers=2, chunk_size=8)
@@ -0,0 +1,16 @@
+from helpers import day_module, input_paths
+
+day07 = day_module("day07")
+
+
+def test_solvers_match_recursive_solver():
+    for path in input_paths("day07", 200, range(20), min_operands=1, max_operands=10):
+        equations = day07.read_input(path)
+        for allow_concatenation in (False, True):
+            for target, array in equations:
+                expected = day07.is_equation_solvable(target, array, allow_concatenation)
+                for solver in (day07.is_equation_solvable_iterative, day07.is_equation_solvable_meet_in_the_middle):
+                    assert solver(target, array, allow_concatenation) == expected, (solver.__name__, target, array)
+            expected = day07.sum_solvable_equation_targets(equations, allow_concatenation)
+            assert day07.sum_solvable_equation_targets_parallel(equations, allow_concatenation, workers=2, chunk_size=37) == expected, path
+            assert day07.sum_solvable_equation_targets(day07.iter_equations(path), allow_concatenation) == expected, path
@@ -0,0 +1,36 @@
+import numpy as np
+
+from helpers import day_module, input_paths, puzzle_input
+
+day08 = day_module("day08")
+
+
+def test_bitmap_matches_pairwise_loops_on_input():
+    grid, antennas = day08.read_input(puzzle_input("day08"))
+    for include_antenna_positions in (False, True):
+        expected = day08.count_valid_antinodes(grid, day08.calculate_antinodes(grid, antennas, include_antenna_positions))
+        for chunk_size in (1, 64, 1 << 20):
+            bitmap = day08.calculate_antinode_bitmap(grid, antennas, include_antenna_positions, chunk_size)
+            assert int(np.count_nonzero(bitmap)) == expected
+
+
+def random_map_paths():
+    # small dense maps, and larger sparse ones where reduced steps exceed LONG_LINE_STEP
+    for size, seeds, antenna_density in ((20, range(30), 0.3), (80, range(5), 0.05)):
+        paths = input_paths("day08", size, seeds, antenna_density=antenna_density)
+        next(paths) # only generated maps
+        yield from paths
+
+
+def test_bitmap_matches_brute_force_on_random_maps():
+    for path in random_map_paths():
+        grid, antennas = day08.read_input(path)
+        rows, cols = len(grid), len(grid[0])
+        expected = day08.count_valid_antinodes(grid, day08.calculate_antinodes(grid, antennas, False))
+        assert int(np.count_nonzero(day08.calculate_antinode_bitmap(grid, antennas, False, 7))) == expected
+        # part 2: a cell is an antinode if it is collinear with two antennas of the same frequency
+        expected = {(r, c) for r in range(rows) for c in range(cols) for array in antennas.values()
+                    for i, (r1, c1) in enumerate(array) for r2, c2 in array[i + 1:]
+                    if (r2 - r1) * (c - c1) == (c2 - c1) * (r - r1)}
+        bitmap = day08.calculate_antinode_bitmap(grid, antennas, True, 7)
+        assert set(zip(*np.nonzero(bitmap))) == expected
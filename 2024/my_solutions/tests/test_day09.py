@@ -0,0 +1,11 @@
+from helpers import day_module, input_paths
+
+day09 = day_module("day09")
+
+
+def test_compaction_matches_block_lists():
+    for path in input_paths("day09", 201, range(200)):
+        expected = day09.compact_disk_and_calculate_checksum(day09.read_input_p1(path))
+        assert day09.compact_disk_map_and_calculate_checksum(day09.read_disk_map(path)) == expected, path
+        expected = day09.compact_files_by_whole_blocks_and_calculate_checksum(*day09.read_input_p2(path))
+        assert day09.compact_files_with_free_space_heaps(*day09.read_input_p2(path)) == expected, path
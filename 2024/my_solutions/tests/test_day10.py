@@ -0,0 +1,15 @@
+from helpers import day_module, generate, puzzle_input
+
+day10 = day_module("day10")
+
+
+def test_whole_grid_scores_match_per_trailhead_search():
+    grids = [day10.read_input(puzzle_input("day10"))]
+    grids += [[[int(char) for char in line] for line in generate("day10", size, seed, noise=noise).splitlines()]
+              for seed, (size, noise) in enumerate([(1, 0.1), (2, 0.5), (9, 0.1), (30, 0.1), (30, 0.5), (50, 1.0)] * 3)]
+    for grid in grids:
+        for mode in ("score", "rating"):
+            assert day10.calculate_total_score_dp(grid, mode) == day10.calculate_total_score(grid, mode), mode
+        expected = day10.calculate_total_score(grid, "score")
+        for chunk_words in (None, 1, 4):
+            assert day10.calculate_total_score_bitsets(grid, chunk_words) == expected, chunk_words
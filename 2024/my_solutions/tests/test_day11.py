@@ -0,0 +1,43 @@
+from helpers import day_module, generate, puzzle_input
+
+day11 = day_module("day11")
+
+STONES = day11.read_input(puzzle_input("day11"))
+STONE_SETS = [STONES] + [[int(x) for x in generate("day11", size, seed).split()] for seed, size in enumerate([1, 3, 8, 20] * 3)]
+
+
+def test_count_map_matches_simulation_and_recursion():
+    memo = day11.memoized_blink(maxsize=64)
+    for stones in STONE_SETS:
+        assert day11.count_stones_after_blinks(stones, 25) == day11.simulate_blinks(stones)
+        expected = sum(day11.calc_stones_after_blinks(stone, 75) for stone in stones)
+        assert day11.count_stones_after_blinks(stones, 75) == expected
+        assert day11.count_stones_after_blinks(stones, 75, transition=memo) == expected
+    assert memo.cache_info().currsize <= 64
+
+
+def test_matrix_power_matches_count_map():
+    # small graphs (the 54 values reachable from single digits) at many blink counts
+    for stones in ([0], [1, 7], [2024], [125, 17]):
+        for blinks in (0, 1, 5, 40, 75, 500):
+            expected = day11.count_stones_after_blinks(stones, blinks)
+            for method in ("auto", "matrix", "step"):
+                assert day11.count_stones_matrix_power(stones, blinks, method=method) == expected
+                assert day11.count_stones_matrix_power(stones, blinks, modulus=1_000_000_007, method=method) == expected % 1_000_000_007
+                assert day11.count_stones_matrix_power(stones, blinks, modulus=2 ** 61 - 1, method=method) == expected % (2 ** 61 - 1)
+    expected = day11.count_stones_after_blinks(STONES, 75) % 1_000_000_007
+    for method in ("auto", "matrix"):
+        assert day11.count_stones_matrix_power(STONES, 75, modulus=1_000_000_007, method=method) == expected
+
+
+def test_vectorized_blinks_match_count_map():
+    for stones in STONE_SETS + [[], [0], [10 ** 17], [2 ** 62], [9 * 10 ** 18 // 2024 + 1], [2 ** 63], [7, 10 ** 30]]:
+        for blinks in (0, 1, 25, 75):
+            assert day11.count_stones_vectorized(stones, blinks) == day11.count_stones_after_blinks(stones, blinks), (stones, blinks)
+    # counts past int64
+    assert day11.count_stones_vectorized([0], 300) == day11.count_stones_after_blinks([0], 300)
+
+
+def test_count_digits():
+    for stone in list(range(1, 1000)) + [10 ** k - 1 for k in range(1, 40)] + [10 ** k for k in range(40)]:
+        assert day11.count_digits(stone) == len(str(stone)), stone
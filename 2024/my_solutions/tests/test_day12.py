@@ -0,0 +1,21 @@
+from helpers import day_module, generate, puzzle_input
+
+day12 = day_module("day12")
+
+
+def test_scanline_labeling_matches_region_search():
+    grids = [day12.read_input(puzzle_input("day12"))]
+    grids += [[list(line) for line in generate("day12", size, seed, noise=noise).splitlines()]
+              for seed, (size, noise) in enumerate([(1, 0.1), (2, 0.5), (7, 0.3), (30, 0.05), (30, 0.5), (60, 0.2)] * 3)]
+    grids.append([list("ABAB")]) # single row
+    grids.append([["A"], ["B"], ["B"], ["A"]]) # single column
+    grids.append([list(line) for line in ["AAAAAA", "AAABBA", "AAABBA", "ABBAAA", "ABBAAA", "AAAAAA"]]) # regions touching diagonally
+    for grid in grids:
+        regions = day12.find_regions(grid)
+        labels, areas, perimeters, sides = day12.label_regions(grid)
+        assert areas == [len(region) for region in regions]
+        assert perimeters == [day12.calculate_region_perimeter(region) for region in regions]
+        assert sides == [day12.count_sides(region) for region in regions]
+        assert all(labels[r][c] == index for index, region in enumerate(regions) for r, c in region)
+        vectorized = day12.measure_regions_vectorized(labels)
+        assert [measure.tolist() for measure in vectorized] == [areas, perimeters, sides]